@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+This script times the parts of the app we care about performance-wise.
+Run it against a copy of your database - it writes (and then removes) test rows.
+
+    python benchmark_suite.py
+"""
+
+import datetime
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from threading import Thread, Barrier
+
+from flask import Flask
+from app import (app, create_app, db, BLUEPRINTS, Card, Usage, SEED_TABLES, read_seed_data, seed_table_rows,
+                 load_seed_tables, initialize_database, wallet_context, reset_expired_credits, rebuild_usage_rollup,
+                 ALL_WALLETS, DEFAULT_WALLET_ID, Wallet, WalletState)
+
+BENCHMARK_MARKER = '[benchmark]'
+
+def _percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+def _post_usage_burst(card_id, threads, requests_per_thread):
+    """Fire POST /api/usage from several threads at once and collect per-request latency"""
+    latencies = []
+    errors = []
+
+    def worker(worker_id):
+        with app.test_client() as client:
+            for i in range(requests_per_thread):
+                payload = {
+                    'card_id': card_id,
+                    'benefit_type': 'credit',
+                    'benefit_id': 1,
+                    'amount': 1.0,
+                    'description': f'{BENCHMARK_MARKER} worker {worker_id} request {i}'
+                }
+                started = time.perf_counter()
+                response = client.post('/api/usage',
+                                       data=json.dumps(payload),
+                                       content_type='application/json')
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 201:
+                    errors.append(response.status_code)
+
+    workers = [Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+def _report(label, latencies, errors, elapsed):
+    total = len(latencies)
+    print(f"   {label}")
+    print(f"      {total} requests in {elapsed:.2f}s -> {total / elapsed:,.0f} req/s")
+    print(f"      latency p50 {statistics.median(latencies) * 1000:.1f}ms, "
+          f"p95 {_percentile(latencies, 95) * 1000:.1f}ms, "
+          f"max {max(latencies) * 1000:.1f}ms")
+    if errors:
+        print(f"      ⚠️  {len(errors)} failed requests (status codes: {sorted(set(errors))})")
+
+def benchmark_usage_writes(threads=8, requests_per_thread=50):
+    """Compare per-request commits with the group-commit usage writer"""
+    print("\n📝 POST /api/usage: per-request commit vs group commit")
+
+    with app.app_context():
+        card = Card.query.first()
+        if not card:
+            print("   ❌ No cards in the database - run app.py once to add sample data")
+            return
+        card_id = card.id
+
+    original_setting = app.config['USAGE_WRITE_BEHIND']
+    try:
+        for label, write_behind in (('Per-request commit', False), ('Group commit', True)):
+            app.config['USAGE_WRITE_BEHIND'] = write_behind
+            latencies, errors, elapsed = _post_usage_burst(card_id, threads, requests_per_thread)
+            _report(label, latencies, errors, elapsed)
+    finally:
+        app.config['USAGE_WRITE_BEHIND'] = original_setting
+        with app.app_context():
+            Usage.query.filter(Usage.description.startswith(BENCHMARK_MARKER)).delete(synchronize_session=False)
+            db.session.commit()
+
+def _orm_seed_load(table_names):
+    """The old way of seeding: one ORM object per row, flushed through the unit of work"""
+    models = {mapper.local_table.name: mapper.class_ for mapper in db.Model.registry.mappers}
+    seed = read_seed_data()
+    for table_name in table_names:
+        db.session.add_all(models[table_name](**row) for row in seed_table_rows(seed, table_name))
+        db.session.flush()
+    db.session.commit()
+
+def _bulk_seed_load(table_names):
+    """The seed path the app uses: one executemany INSERT per table"""
+    load_seed_tables(table_names)
+    db.session.commit()
+
+def benchmark_seed_load(repeats=5):
+    """Time filling a brand new database with the legacy sample data, ORM objects vs bulk inserts"""
+    print("\n🌱 Fresh database seeding: per-object ORM inserts vs bulk inserts")
+
+    # A throwaway database, so the real one is never touched
+    seed_dir = tempfile.mkdtemp()
+    seed_app = Flask('seed_benchmark')
+    seed_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(seed_dir, 'seed.db')
+    db.init_app(seed_app)
+    table_names = SEED_TABLES
+
+    try:
+        with seed_app.app_context():
+            for label, load in (('Per-object ORM inserts', _orm_seed_load), ('Bulk inserts', _bulk_seed_load)):
+                timings = []
+                for _ in range(repeats):
+                    db.session.remove()
+                    db.drop_all()
+                    db.create_all()
+                    started = time.perf_counter()
+                    load(table_names)
+                    timings.append(time.perf_counter() - started)
+                print(f"   {label}")
+                print(f"      median {statistics.median(timings) * 1000:.1f}ms, "
+                      f"first run {timings[0] * 1000:.1f}ms over {repeats} fresh databases")
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        for file_name in os.listdir(seed_dir):
+            os.remove(os.path.join(seed_dir, file_name))
+        os.rmdir(seed_dir)
+
+def _import_times(top=8):
+    """Import app once in a fresh interpreter with -X importtime; return (total ms, slowest modules)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    entries = []
+    for line in result.stderr.splitlines():
+        # Lines look like: "import time:   self [us] |  cumulative | module"
+        parts = line.split('|')
+        if not line.startswith('import time:') or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        module = parts[2].rstrip()
+        entries.append((int(parts[1]) / 1000, module.strip(), len(module) - len(module.lstrip())))
+    total = next((ms for ms, module, depth in entries if module == 'app'), 0.0)
+    # Nesting is shown by indentation; keep the modules app.py imports directly
+    app_depth = next((depth for ms, module, depth in entries if module == 'app'), 1)
+    direct = [(ms, module) for ms, module, depth in entries if depth == app_depth + 2]
+    return total, sorted(direct, reverse=True)[:top]
+
+def benchmark_startup(repeats=5):
+    """Time a cold `import app` and how long create_app takes for different blueprint sets"""
+    print("\n🚀 Startup: cold import and create_app")
+
+    cold_imports = []
+    slowest = []
+    for _ in range(repeats):
+        total, slowest = _import_times()
+        cold_imports.append(total)
+    print(f"   Cold `import app` (fresh interpreter): median {statistics.median(cold_imports):.1f}ms over {repeats} runs")
+    print("   Slowest imports made by app.py (cumulative):")
+    for ms, module in slowest:
+        print(f"      {ms:7.1f}ms  {module}")
+
+    for blueprints in (list(BLUEPRINTS), ['api'], ['dashboard']):
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            create_app(blueprints=blueprints)
+            timings.append(time.perf_counter() - started)
+        print(f"   create_app({','.join(blueprints)}): median {statistics.median(timings) * 1000:.1f}ms")
+
+# Wallet tables copied for every synthetic wallet, with the id columns that need moving into the
+# copy's own id range (usage.card_id points at the shared Card table, so it stays as it is)
+WALLET_BENCHMARK_TABLES = {
+    'card_enhanced': ('id',),
+    'credit_benefit2': ('id', 'card_id', 'spending_bonus_id'),
+    'signup_bonus': ('id', 'card_id'),
+    'spending_bonus': ('id', 'card_id'),
+    'other_bonus': ('id', 'card_id'),
+    'credit_status': ('id',),
+    'credit_status_interval': ('id',),
+    'card_benefit_summary': ('card_id',),
+    'dashboard_item': ('id', 'entity_id', 'spending_bonus_id'),
+    'usage': ('id',),
+}
+
+# Requests timed for one wallet, before and after the database holds many more
+WALLET_BENCHMARK_REQUESTS = ('/', '/api/changes?since=0', '/api/wallet', '/api/valuation', '/api/forecast',
+                             '/api/upcoming', '/api/analytics/usage?group=card,month')
+
+def _time_wallet_requests(client, wallet_id, repeats):
+    """Median time of each WALLET_BENCHMARK_REQUESTS path for one wallet, in ms"""
+    timings = {}
+    for path in WALLET_BENCHMARK_REQUESTS:
+        samples = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            response = client.get(path, headers={'X-Wallet-ID': str(wallet_id)})
+            samples.append(time.perf_counter() - started)
+            assert response.status_code == 200, (path, response.status_code)
+        timings[path] = statistics.median(samples) * 1000
+    return timings
+
+def _time_scheduler_run():
+    """Time one reset_expired_credits sweep over every wallet, in ms"""
+    with wallet_context(ALL_WALLETS):
+        started = time.perf_counter()
+        reset_expired_credits()
+        return (time.perf_counter() - started) * 1000
+
+def _fill_wallets(wallet_count, chunk_rows=20000):
+    """
+    Copy wallet 1's rows into wallets 2..wallet_count with executemany inserts.
+    Each copy gets its own id range (wallet n's ids are wallet 1's plus (n - 1) * stride).
+    """
+    connection = db.session.connection()
+    tables = {name: db.metadata.tables[name] for name in WALLET_BENCHMARK_TABLES}
+    source_rows = {name: [dict(row._mapping) for row in connection.execute(
+        db.select(table).where(table.c.wallet_id == DEFAULT_WALLET_ID)
+    )] for name, table in tables.items()}
+    stride = 1 + max((row[column] or 0) for name, rows in source_rows.items()
+                     for row in rows for column in WALLET_BENCHMARK_TABLES[name])
+    version = connection.execute(db.select(WalletState.version).where(WalletState.id == DEFAULT_WALLET_ID)).scalar() or 0
+
+    wallet_ids = range(DEFAULT_WALLET_ID + 1, wallet_count + 1)
+    connection.execute(Wallet.__table__.insert(), [{'id': wallet_id, 'name': f'Benchmark wallet {wallet_id}'} for wallet_id in wallet_ids])
+    connection.execute(WalletState.__table__.insert(), [{'id': wallet_id, 'version': version} for wallet_id in wallet_ids])
+    for name, rows in source_rows.items():
+        batch = []
+        for wallet_id in wallet_ids:
+            offset = (wallet_id - DEFAULT_WALLET_ID) * stride
+            for row in rows:
+                copy = dict(row, wallet_id=wallet_id)
+                for column in WALLET_BENCHMARK_TABLES[name]:
+                    if copy[column] is not None:
+                        copy[column] += offset
+                batch.append(copy)
+            if len(batch) >= chunk_rows:
+                connection.execute(tables[name].insert(), batch)
+                batch = []
+        if batch:
+            connection.execute(tables[name].insert(), batch)
+    db.session.commit()
+    return {name: len(rows) * wallet_count for name, rows in source_rows.items()}
+
+def _explain(sql, **params):
+    """SQLite's query plan for a statement, as one line"""
+    rows = db.session.execute(db.text('EXPLAIN QUERY PLAN ' + sql), params).all()
+    return '; '.join(row[-1] for row in rows)
+
+def benchmark_multi_wallet(wallet_count=10000, repeats=10):
+    """
+    Time the dashboard, APIs and scheduler for one wallet in a database holding one wallet,
+    then again once it holds wallet_count wallets. Wallet-led indexes should keep the per-wallet
+    requests flat; the scheduler sweep grows with the rows that are actually due.
+    """
+    print(f"\n👛 Multi-wallet database: 1 wallet vs {wallet_count:,} wallets")
+
+    wallet_dir = tempfile.mkdtemp()
+    wallet_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(wallet_dir, 'wallets.db'),
+        'USAGE_WRITE_BEHIND': False,
+    }, blueprints=['dashboard', 'api', 'actions'])
+
+    try:
+        with wallet_app.app_context(), wallet_app.test_client() as client:
+            initialize_database()
+            with wallet_context(ALL_WALLETS):
+                reset_expired_credits()  # Bring the sample reset dates up to today first
+            card_id = Card.query.first().id
+            today = datetime.datetime.now()
+            db.session.add_all(Usage(card_id=card_id, benefit_type='purchase', benefit_id=1, amount=25.0 + day,
+                                     description=f'{BENCHMARK_MARKER} purchase', date_used=today - datetime.timedelta(days=day))
+                               for day in range(5))
+            db.session.commit()
+
+            client.get('/')  # Builds the dashboard rows once
+            single = _time_wallet_requests(client, DEFAULT_WALLET_ID, repeats)
+            single_scheduler = _time_scheduler_run()
+
+            started = time.perf_counter()
+            row_counts = _fill_wallets(wallet_count)
+            rebuild_usage_rollup()
+            print(f"   Filled {wallet_count:,} wallets ({sum(row_counts.values()):,} rows) in {time.perf_counter() - started:.1f}s")
+
+            many = _time_wallet_requests(client, wallet_count // 2, repeats)
+            many_scheduler = _time_scheduler_run()
+
+            print(f"   {'request (one wallet)':<40} {'1 wallet':>10} {f'{wallet_count:,} wallets':>14}")
+            for path in WALLET_BENCHMARK_REQUESTS:
+                print(f"   {path:<40} {single[path]:>8.1f}ms {many[path]:>12.1f}ms")
+            print(f"   {'scheduler: reset_expired_credits':<40} {single_scheduler:>8.1f}ms {many_scheduler:>12.1f}ms")
+
+            if db.engine.dialect.name == 'sqlite':
+                print("   Query plans for one wallet:")
+                for label, sql in (
+                    ('dashboard rows', 'SELECT * FROM dashboard_item WHERE wallet_id = :wallet_id ORDER BY section, sort_value DESC'),
+                    ('change feed', 'SELECT * FROM credit_benefit2 WHERE wallet_id = :wallet_id AND row_version > 0'),
+                    ('recent usage', "SELECT * FROM usage WHERE wallet_id = :wallet_id AND date_used >= '2026-01-01'"),
+                ):
+                    print(f"      {label}: {_explain(sql, wallet_id=wallet_count // 2)}")
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        for file_name in os.listdir(wallet_dir):
+            os.remove(os.path.join(wallet_dir, file_name))
+        os.rmdir(wallet_dir)
+
+def _cold_dashboard_burst(threads, rounds):
+    """Empty the page cache, then have every thread ask for the dashboard at the same moment; repeat"""
+    latencies = []
+    errors = []
+    elapsed = 0.0
+    for _ in range(rounds):
+        app.extensions['dashboard_pages'].clear()
+        barrier = Barrier(threads)
+
+        def worker():
+            with app.test_client() as client:
+                barrier.wait()
+                started = time.perf_counter()
+                response = client.get('/')
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+
+        workers = [Thread(target=worker) for _ in range(threads)]
+        started = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed += time.perf_counter() - started
+    return latencies, errors, elapsed
+
+def benchmark_dashboard_stampede(threads=16, rounds=5):
+    """Cold dashboard cache hit by many requests at once: every request builds vs one shared build"""
+    print("\n🐘 Cold dashboard under concurrent requests: independent builds vs single-flight")
+
+    with app.test_client() as client:
+        client.get('/')  # Settle any lazy credit resets first
+    original_setting = app.config['DASHBOARD_SINGLE_FLIGHT']
+    builds = app.extensions['dashboard_builds']
+    try:
+        for label, single_flight in (('Every request builds', False), ('Single-flight', True)):
+            app.config['DASHBOARD_SINGLE_FLIGHT'] = single_flight
+            leaders, followers = builds.leaders, builds.followers
+            latencies, errors, elapsed = _cold_dashboard_burst(threads, rounds)
+            _report(label, latencies, errors, elapsed)
+            if single_flight:
+                print(f"      {builds.leaders - leaders} builds for {len(latencies)} requests "
+                      f"({builds.followers - followers} waited on a build already running)")
+    finally:
+        app.config['DASHBOARD_SINGLE_FLIGHT'] = original_setting
+
+def run_all_benchmarks():
+    print("⏱️  Running benchmark suite")
+    print("=" * 40)
+    benchmark_usage_writes()
+    benchmark_seed_load()
+    benchmark_startup()
+    benchmark_dashboard_stampede()
+    benchmark_multi_wallet()
+
+if __name__ == "__main__":
+    run_all_benchmarks()
@@ -3,23 +3,24 @@
 Categorize bonuses correctly: Time-limited sign-up bonuses vs ongoing threshold bonuses
 """
 
-import sqlite3
 from datetime import datetime
+from app import app, db
 
 def categorize_bonuses():
     """Analyze and properly categorize all bonuses"""
     print("=== CATEGORIZING BONUSES ===\n")
 
-    conn = sqlite3.connect('instance/test.db')
-    cursor = conn.cursor()
+    # Works on whichever database the app is configured for (SQLite or PostgreSQL)
+    ctx = app.app_context()
+    ctx.push()
+    connection = db.session.connection()
 
     # Get current signup bonuses with card names
-    cursor.execute("""
+    current_signup_bonuses = connection.execute(db.text("""
         SELECT s.id, s.card_id, s.bonus_amount, s.description, s.required_spend, s.deadline, c.name
         FROM signup_bonus s
         JOIN card_enhanced c ON s.card_id = c.id
-    """)
-    current_signup_bonuses = cursor.fetchall()
+    """)).all()
 
     print("CURRENT SIGNUP BONUSES TO CATEGORIZE:")
     for bonus in current_signup_bonuses:
@@ -59,56 +60,56 @@ def categorize_bonuses():
 
     # Update sign-up bonuses with correct spend requirements and descriptions
     for card_name, amount, description, required_spend in true_signup_bonuses:
-        cursor.execute("""
+        result = connection.execute(db.text("""
             UPDATE signup_bonus
-            SET required_spend = ?,
-                bonus_amount = ?,
-                description = ?
-            WHERE card_id = (SELECT id FROM card_enhanced WHERE name = ?)
-            AND bonus_amount LIKE ?
-        """, (required_spend, amount, description, card_name, f"%{amount.split()[0]}%"))
-
-        if cursor.rowcount > 0:
+            SET required_spend = :required_spend,
+                bonus_amount = :amount,
+                description = :description
+            WHERE card_id = (SELECT id FROM card_enhanced WHERE name = :card_name)
+            AND bonus_amount LIKE :pattern
+        """), {'required_spend': required_spend, 'amount': amount, 'description': description,
+               'card_name': card_name, 'pattern': f"%{amount.split()[0]}%"})
+
+        if result.rowcount > 0:
             print(f"✅ SIGN-UP BONUS: {card_name} - {amount} ({description}) - ${required_spend:,.0f} required")
 
     # Move threshold bonuses to other_bonus table
     bonuses_to_move = []
     for card_name, amount, description, required_spend in threshold_bonuses:
-        cursor.execute("""
+        bonus_records = connection.execute(db.text("""
             SELECT id FROM signup_bonus
-            WHERE card_id = (SELECT id FROM card_enhanced WHERE name = ?)
-            AND (bonus_amount LIKE ? OR description LIKE ?)
-        """, (card_name, f"%{amount}%", f"%{description}%"))
-
-        bonus_records = cursor.fetchall()
+            WHERE card_id = (SELECT id FROM card_enhanced WHERE name = :card_name)
+            AND (bonus_amount LIKE :amount OR description LIKE :description)
+        """), {'card_name': card_name, 'amount': f"%{amount}%", 'description': f"%{description}%"}).all()
         for (bonus_id,) in bonus_records:
             bonuses_to_move.append(bonus_id)
 
             # Insert into other_bonus
-            cursor.execute("""
+            connection.execute(db.text("""
                 INSERT INTO other_bonus
                 (card_id, bonus_type, bonus_amount, description, required_spend, frequency, created_date)
                 VALUES (
-                    (SELECT id FROM card_enhanced WHERE name = ?),
+                    (SELECT id FROM card_enhanced WHERE name = :card_name),
                     'threshold',
-                    ?,
-                    ?,
-                    ?,
+                    :amount,
+                    :description,
+                    :required_spend,
                     'ongoing',
-                    ?
+                    :created_date
                 )
-            """, (card_name, amount, description, required_spend, datetime.now().isoformat()))
+            """), {'card_name': card_name, 'amount': amount, 'description': description,
+                   'required_spend': required_spend, 'created_date': datetime.now()})
 
             print(f"📊 THRESHOLD BONUS: {card_name} - {amount} ({description}) - ${required_spend:,.0f} threshold")
 
     # Remove moved bonuses from signup_bonus table
     for bonus_id in bonuses_to_move:
-        cursor.execute("DELETE FROM signup_bonus WHERE id = ?", (bonus_id,))
+        connection.execute(db.text("DELETE FROM signup_bonus WHERE id = :id"), {'id': bonus_id})
 
     print(f"\nMoved {len(bonuses_to_move)} bonuses from sign-up to threshold category")
 
-    conn.commit()
-    conn.close()
+    db.session.commit()
+    ctx.pop()
 
     print("\n" + "="*80)
     print("FINAL CATEGORIZATION SUMMARY:")
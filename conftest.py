@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Test Setup
+pytest loads this before any test file. The module-level app in app.py reads DATABASE_URL when it is
+imported, so unless one is given (run_postgres_tests.py passes its own), the tests get a throwaway
+SQLite database instead of the local instance/test.db, and a fixed session key so nothing is
+written to the instance folder.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+import pytest
+
+if 'DATABASE_URL' not in os.environ:
+    _database_dir = tempfile.mkdtemp()
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_database_dir, 'test.db')
+    atexit.register(shutil.rmtree, _database_dir, ignore_errors=True)
+os.environ.setdefault('SECRET_KEY', 'test-session-key')
+
+@pytest.fixture(scope='session', autouse=True)
+def test_database():
+    """Create, seed and sync the test database once, before the first test"""
+    from app import app, initialize_database
+    with app.app_context():
+        initialize_database()
+    yield
@@ -4,32 +4,30 @@ Data Audit Script: Compare current database data with source of truth
 This script will help us understand what's currently in the database vs what should be there
 """
 
-import sqlite3
 import csv
 from collections import defaultdict
+from app import app, db
 
 def audit_current_data():
     """Examine what's currently in the database"""
     print("=== CURRENT DATABASE AUDIT ===\n")
 
-    # Connect to the database
-    conn = sqlite3.connect('instance/test.db')
-    cursor = conn.cursor()
+    # Connect to whichever database the app is configured for (SQLite or PostgreSQL)
+    ctx = app.app_context()
+    ctx.push()
+    inspector = db.inspect(db.engine)
 
     # Check what tables exist
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = cursor.fetchall()
+    tables = inspector.get_table_names()
     print("Available tables:")
     for table in tables:
-        print(f"  - {table[0]}")
+        print(f"  - {table}")
     print()
 
     # Check CardEnhanced table
     try:
-        cursor.execute("SELECT * FROM card_enhanced")
-        cards = cursor.fetchall()
-        cursor.execute("PRAGMA table_info(card_enhanced)")
-        columns = [col[1] for col in cursor.fetchall()]
+        cards = db.session.execute(db.text("SELECT * FROM card_enhanced")).all()
+        columns = [column['name'] for column in inspector.get_columns('card_enhanced')]
 
         print("CURRENT CARDS (CardEnhanced):")
         print(f"Columns: {columns}")
@@ -41,10 +39,8 @@ def audit_current_data():
 
     # Check SpendingBonus table (Points Multipliers)
     try:
-        cursor.execute("SELECT * FROM spending_bonus")
-        bonuses = cursor.fetchall()
-        cursor.execute("PRAGMA table_info(spending_bonus)")
-        columns = [col[1] for col in cursor.fetchall()]
+        bonuses = db.session.execute(db.text("SELECT * FROM spending_bonus")).all()
+        columns = [column['name'] for column in inspector.get_columns('spending_bonus')]
 
         print("CURRENT SPENDING BONUSES (Points Multipliers):")
         print(f"Columns: {columns}")
@@ -56,10 +52,8 @@ def audit_current_data():
 
     # Check CreditBenefit2 table
     try:
-        cursor.execute("SELECT * FROM credit_benefit2")
-        credits = cursor.fetchall()
-        cursor.execute("PRAGMA table_info(credit_benefit2)")
-        columns = [col[1] for col in cursor.fetchall()]
+        credits = db.session.execute(db.text("SELECT * FROM credit_benefit2")).all()
+        columns = [column['name'] for column in inspector.get_columns('credit_benefit2')]
 
         print("CURRENT CREDIT BENEFITS:")
         print(f"Columns: {columns}")
@@ -71,10 +65,8 @@ def audit_current_data():
 
     # Check SignupBonus table
     try:
-        cursor.execute("SELECT * FROM signup_bonus")
-        signups = cursor.fetchall()
-        cursor.execute("PRAGMA table_info(signup_bonus)")
-        columns = [col[1] for col in cursor.fetchall()]
+        signups = db.session.execute(db.text("SELECT * FROM signup_bonus")).all()
+        columns = [column['name'] for column in inspector.get_columns('signup_bonus')]
 
         print("CURRENT SIGNUP BONUSES:")
         print(f"Columns: {columns}")
@@ -84,7 +76,7 @@ def audit_current_data():
     except Exception as e:
         print(f"Error reading signup_bonus: {e}")
 
-    conn.close()
+    ctx.pop()
 
 def parse_source_of_truth():
     """Parse the source of truth data provided by the user"""
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Reset Calendar
+Works out which reset period a credit is in for any date, in one step.
+Instead of moving a reset date forward one period at a time, we count how many
+whole periods fit between the credit's anchor date and the day we care about.
+
+Supported schedules:
+- Calendar month / quarter / half / year (credits without a reset date line up with January 1,
+  and so do credits whose reset date is the last day of a period, like Mar 31 for a quarterly one)
+- Cardmember-year anniversaries (any other reset date is used as the anchor)
+- Every 4 years (one-time credits like Global Entry / TSA PreCheck)
+"""
+
+import datetime
+from dateutil.relativedelta import relativedelta
+
+# Length of each reset period in months
+PERIOD_MONTHS = {
+    'monthly': 1,
+    'quarterly': 3,
+    'semi-annual': 6,
+    'annual': 12,
+}
+
+# Global Entry / TSA PreCheck style credits come back every 4 years
+EVERY_FOUR_YEARS_MONTHS = 48
+
+# Calendar periods (months, quarters, halves, years) all line up with this date
+CALENDAR_ANCHOR = datetime.date(2000, 1, 1)
+
+def period_months(frequency, description=None):
+    """
+    Get the length of a credit's reset period in months.
+    Returns None for credits that never reset.
+    """
+    months = PERIOD_MONTHS.get((frequency or '').lower())
+    if months:
+        return months
+    if description and 'every 4 years' in description.lower():
+        return EVERY_FOUR_YEARS_MONTHS
+    return None
+
+def is_period_end(reset_date, months):
+    """
+    True when reset_date is the last day of a calendar period of this length: the last day of any
+    month for monthly credits, Mar 31 / Jun 30 / Sep 30 / Dec 31 for quarterly ones, Dec 31 for annual ones.
+    Such a date says when the current period ends, so the next period starts the day after it.
+    """
+    next_day = reset_date + datetime.timedelta(days=1)
+    return next_day.day == 1 and (next_day.month - 1) % months == 0
+
+def period_anchor(reset_date, months):
+    """The date a credit's reset periods are counted from"""
+    if reset_date is None:
+        return CALENDAR_ANCHOR
+    if is_period_end(reset_date, months):
+        return reset_date + datetime.timedelta(days=1)
+    return reset_date
+
+def period_boundary(anchor, months, index):
+    """The index-th reset boundary after (or before, if negative) the anchor date"""
+    # Always measure from the anchor so month-end dates don't drift (Mar 31 -> Jun 30 -> Sep 30 -> Dec 31)
+    return anchor + relativedelta(months=months * index)
+
+def period_window(anchor, months, on_date):
+    """
+    Get the (start, end) of the reset period containing on_date, where start <= on_date < end.
+    This is a closed-form calculation, so a reset date that is years out of date costs the same
+    as one that is current.
+    """
+    month_diff = (on_date.year - anchor.year) * 12 + (on_date.month - anchor.month)
+    index = month_diff // months
+
+    # The month count can be one period off when the anchor's day of month is later than on_date's
+    if period_boundary(anchor, months, index) > on_date:
+        index -= 1
+    elif period_boundary(anchor, months, index + 1) <= on_date:
+        index += 1
+
+    return period_boundary(anchor, months, index), period_boundary(anchor, months, index + 1)
+
+def credit_window(reset_date, frequency, description=None, on_date=None):
+    """
+    Get the (start, end) reset window for a single credit, or None if it never resets.
+    The credit's reset_date is used as its anchor (the day after it when it is the last day of a
+    period); credits without one follow the calendar.
+    """
+    months = period_months(frequency, description)
+    if not months:
+        return None
+    return period_window(period_anchor(reset_date, months), months, on_date or datetime.date.today())
+
+def current_windows(schedules, on_date=None):
+    """
+    Get the reset window for many credits at once.
+    schedules is a list of (reset_date, frequency, description) tuples; the result is a list of
+    (start, end) windows (or None) in the same order.
+
+    Credits that share a schedule (same anchor and period length - e.g. every monthly credit that
+    resets on the 1st) share one calculation, so the work grows with the number of distinct
+    schedules rather than the number of credits.
+    """
+    on_date = on_date or datetime.date.today()
+    computed = {}
+    windows = []
+
+    for reset_date, frequency, description in schedules:
+        months = period_months(frequency, description)
+        if not months:
+            windows.append(None)
+            continue
+
+        key = (period_anchor(reset_date, months), months)
+        if key not in computed:
+            computed[key] = period_window(key[0], months, on_date)
+        windows.append(computed[key])
+
+    return windows
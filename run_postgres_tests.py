@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Run the test suite against PostgreSQL
+This script starts a throwaway PostgreSQL server in a temporary folder (initdb + pg_ctl),
+creates and seeds the app's tables in it, runs pytest with DATABASE_URL pointing at it,
+and then stops the server and deletes the folder. Nothing touches your real database.
+
+    python run_postgres_tests.py            # the whole suite
+    python run_postgres_tests.py -k search  # extra arguments go to pytest
+
+Needs the PostgreSQL server programs (initdb, pg_ctl) on your PATH and `pip install psycopg[binary]`.
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+
+def free_port():
+    """Ask the operating system for a port nobody is listening on"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def run_postgres_tests(pytest_args):
+    """Start a throwaway server, run pytest against it, and clean up. Returns pytest's exit code."""
+    for program in ('initdb', 'pg_ctl'):
+        if not shutil.which(program):
+            print(f"❌ {program} not found - install the PostgreSQL server programs first")
+            return 1
+
+    data_dir = tempfile.mkdtemp(prefix='wallet-pg-')
+    port = free_port()
+    database_url = f'postgresql+psycopg://postgres@127.0.0.1:{port}/postgres'
+    env = dict(os.environ, DATABASE_URL=database_url)
+
+    try:
+        print(f"🐘 Starting a throwaway PostgreSQL on port {port}...")
+        subprocess.run(['initdb', '-D', data_dir, '-U', 'postgres', '--auth=trust'], check=True, stdout=subprocess.DEVNULL)
+        subprocess.run(['pg_ctl', '-D', data_dir, '-o', f'-p {port} -k {data_dir} -c listen_addresses=127.0.0.1',
+                        '-l', os.path.join(data_dir, 'server.log'), '-w', 'start'], check=True, stdout=subprocess.DEVNULL)
+
+        print("🌱 Creating and seeding the tables...")
+        subprocess.run([sys.executable, '-m', 'flask', '--app', 'app', 'init-db'], check=True, env=env)
+
+        print("🧪 Running the tests...")
+        return subprocess.run([sys.executable, '-m', 'pytest', '-q', *pytest_args], env=env).returncode
+    finally:
+        subprocess.run(['pg_ctl', '-D', data_dir, '-m', 'fast', '-w', 'stop'],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.exit(run_postgres_tests(sys.argv[1:]))
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Shared Cache
+A cache that every worker process on one host shares, kept in a memory-mapped file.
+With gunicorn each worker normally has its own in-memory caches, so the same dashboard is
+built (and held in memory) once per worker. Here a value is stored once, in the OS page cache,
+and every worker reads it straight out of the mapping.
+
+File layout:
+- Header: magic, slot count, generation, and where the next value will be written
+- Index: a fixed number of slots (an open-addressing hash table); each slot says which key
+  lives where in the data area, and which generation it was written in
+- Data area: values are appended one after another (key, then the pickled value)
+
+Clearing everything is one write: bump the generation. Slots from an older generation count
+as empty, and the data area is reused from the start. The same happens when the data area or
+the index fills up, so the cache never needs compacting.
+
+Writers take an exclusive file lock (fcntl, so POSIX only); readers take no lock. Each slot
+carries a sequence number that is odd while it is being written, and readers check it (and the
+generation) before and after reading, treating any change as a miss.
+
+Values are unpickled, so whoever can write the file can run code in every worker. The cache file
+and its lock file are therefore created private (mode 0600), and a file that belongs to another
+user, is writable by anyone else, or is a symlink is refused with PermissionError.
+"""
+
+import errno
+import fcntl
+import hashlib
+import mmap
+import os
+import pickle
+import stat
+import struct
+
+MAGIC = b'WALLETC1'
+
+# magic, slot count, generation, next write offset
+HEADER = struct.Struct('<8sIxxxxQQ')
+# sequence number, key hash, generation, value offset, value length
+SLOT = struct.Struct('<QQQQQ')
+# Length of the key stored in front of each value
+KEY_LENGTH = struct.Struct('<H')
+
+def open_private_file(path):
+    """
+    Open (or create, mode 0600) a file only this user can write, and return its descriptor.
+    Refuses symlinks, anything but a regular file, and files another user owns or could write to.
+    """
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    except OSError as e:
+        if e.errno == errno.ELOOP:
+            raise PermissionError(f'{path} is a symlink') from e
+        raise
+    try:
+        info = os.fstat(fd)
+        if not stat.S_ISREG(info.st_mode):
+            raise PermissionError(f'{path} is not a regular file')
+        if info.st_uid != os.getuid():
+            raise PermissionError(f'{path} belongs to another user (uid {info.st_uid})')
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(f'{path} is writable by other users (mode {stat.S_IMODE(info.st_mode):o})')
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+def key_hash(key):
+    """64-bit hash of a key (never 0, so a zeroed slot can't match anything)"""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little') or 1
+
+class SharedCache:
+    """
+    A key/value cache in a memory-mapped file that several processes can open at once.
+    Keys are strings; values are anything pickle can store.
+    The first process to open the file creates and sizes it; later ones just map it, and must ask for
+    the same size and slot count (a mismatch raises ValueError rather than resizing a file in use).
+    A file (or lock file) someone else could have written raises PermissionError (see open_private_file).
+    """
+
+    def __init__(self, path, size=64 * 1024 * 1024, slots=8192):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock_file = None
+        self.slot_count = slots
+        self.data_start = HEADER.size + slots * SLOT.size
+        self.size = size
+        if self.data_start >= size:
+            raise ValueError(f'{path}: {size} bytes is too small for {slots} slots')
+        try:
+            with self._write_lock():
+                self._open_map(size, slots)
+        except (ValueError, PermissionError):
+            if self._lock_file is not None:
+                self._lock_file.close()
+            raise
+
+    def _open_map(self, size, slots):
+        """Map the file (creating and sizing it if it is new), with the write lock held"""
+        fd = open_private_file(self.path)
+        try:
+            existing_size = os.fstat(fd).st_size
+            if existing_size == 0:
+                os.ftruncate(fd, size)  # A new file
+            elif existing_size != size:
+                # Other processes may have it mapped; resizing it under them can crash them (SIGBUS)
+                raise ValueError(f'{self.path} is {existing_size} bytes, not {size}: every app sharing it must '
+                                 f'use the same size (delete the file to change it)')
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        magic, slot_count, _, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            # New file: start empty at generation 1
+            self._map[:self.data_start] = bytes(self.data_start)
+            HEADER.pack_into(self._map, 0, MAGIC, slots, 1, 0)
+        elif slot_count != slots:
+            self._map.close()
+            raise ValueError(f'{self.path} has {slot_count} slots, not {slots}: every app sharing it must '
+                             f'use the same slot count (delete the file to change it)')
+
+    def _write_lock(self):
+        """Exclusive lock shared by every process that opens the same file"""
+        if self._lock_file is None or self._lock_pid != os.getpid():
+            # flock belongs to the open file, and a forked worker (gunicorn --preload) inherits its
+            # parent's, which would let parent and children hold "exclusive" locks at the same time
+            self._lock_file = os.fdopen(open_private_file(self.path + '.lock'), 'r+b')
+            self._lock_pid = os.getpid()
+        lock_file = self._lock_file
+
+        class Lock:
+            def __enter__(self):
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            def __exit__(self, *exc):
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return Lock()
+
+    @property
+    def generation(self):
+        return HEADER.unpack_from(self._map, 0)[2]
+
+    def _slot_offset(self, index):
+        return HEADER.size + index * SLOT.size
+
+    def _probe(self, hashed):
+        """Slot indexes to try for a key hash, in order"""
+        start = hashed % self.slot_count
+        for step in range(self.slot_count):
+            yield (start + step) % self.slot_count
+
+    def get(self, key, default=None):
+        """The value stored for key in the current generation, or default"""
+        encoded = key.encode('utf-8')
+        hashed = key_hash(encoded)
+        generation = self.generation
+        for index in self._probe(hashed):
+            seq, slot_hash, slot_generation, offset, length = SLOT.unpack_from(self._map, self._slot_offset(index))
+            if slot_generation != generation:
+                break  # An empty slot ends the probe: the key was never stored this generation
+            if slot_hash != hashed or seq % 2:
+                continue
+            view = memoryview(self._map)[offset:offset + length]
+            try:
+                (stored_key_length,) = KEY_LENGTH.unpack_from(view, 0)
+                value_start = KEY_LENGTH.size + stored_key_length
+                if view[KEY_LENGTH.size:value_start] != encoded:
+                    continue
+                value = pickle.loads(view[value_start:])  # Decoded straight out of the mapping
+            except Exception:
+                value = _TORN
+            finally:
+                view.release()
+            # If the slot was rewritten or everything was cleared while we read, the value can't be trusted
+            if SLOT.unpack_from(self._map, self._slot_offset(index))[0] != seq or self.generation != generation:
+                break
+            if value is _TORN:
+                break
+            self.hits += 1
+            return value
+        self.misses += 1
+        return default
+
+    def set(self, key, value):
+        """
+        Store value under key for every process. Returns False if it is too big to fit at all.
+        When the data area or the index is full, the generation is bumped (dropping everything) first.
+        """
+        encoded = key.encode('utf-8')
+        payload = KEY_LENGTH.pack(len(encoded)) + encoded + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.data_start + len(payload) > self.size:
+            return False
+        hashed = key_hash(encoded)
+
+        with self._write_lock():
+            for attempt in range(2):
+                _, _, generation, write_offset = HEADER.unpack_from(self._map, 0)
+                offset = max(write_offset, self.data_start)
+                index = self._find_slot(encoded, hashed, generation)
+                if index is not None and offset + len(payload) <= self.size:
+                    break
+                self._bump_generation()
+            else:
+                return False
+
+            self._map[offset:offset + len(payload)] = payload
+            slot_offset = self._slot_offset(index)
+            seq = SLOT.unpack_from(self._map, slot_offset)[0]
+            seq += seq % 2  # (a writer that died mid-write can leave it odd)
+            struct.pack_into('<Q', self._map, slot_offset, seq + 1)  # Odd while the slot is being written
+            SLOT.pack_into(self._map, slot_offset, seq + 1, hashed, generation, offset, len(payload))
+            struct.pack_into('<Q', self._map, slot_offset, seq + 2)  # Even again: readers can trust it
+            HEADER.pack_into(self._map, 0, MAGIC, self.slot_count, generation, offset + len(payload))
+        return True
+
+    def _find_slot(self, encoded, hashed, generation):
+        """The slot already holding key, else the first empty one on its probe path (None if the index is full)"""
+        for index in self._probe(hashed):
+            _, slot_hash, slot_generation, offset, length = SLOT.unpack_from(self._map, self._slot_offset(index))
+            if slot_generation != generation:
+                return index
+            if slot_hash == hashed:
+                (stored_key_length,) = KEY_LENGTH.unpack_from(self._map, offset)
+                if self._map[offset + KEY_LENGTH.size:offset + KEY_LENGTH.size + stored_key_length] == encoded:
+                    return index
+        return None
+
+    def _bump_generation(self):
+        """Drop every entry at once (call with the write lock held)"""
+        generation = self.generation + 1
+        HEADER.pack_into(self._map, 0, MAGIC, self.slot_count, generation, self.data_start)
+        return generation
+
+    def invalidate(self):
+        """Drop every entry, for every process, by bumping the generation. Returns the new generation."""
+        with self._write_lock():
+            return self._bump_generation()
+
+    def stats(self):
+        """Generation, bytes used and this process's hit/miss counts"""
+        _, _, generation, write_offset = HEADER.unpack_from(self._map, 0)
+        return {
+            'generation': generation,
+            'bytes_used': max(write_offset - self.data_start, 0),
+            'bytes_total': self.size - self.data_start,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def close(self):
+        self._map.close()
+        self._lock_file.close()
+
+# Marks a value that failed to decode because it was overwritten mid-read
+_TORN = object()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+App Factory Test
+Checks that create_app() applies config overrides, registers only the blueprints asked for,
+and that the default app still serves every route group.
+"""
+
+import os
+import shutil
+import tempfile
+from app import app, create_app, db, initialize_database, BLUEPRINTS, CardEnhanced
+
+def test_app_factory():
+    """Test create_app against a throwaway database"""
+    print("🧪 Testing the app factory")
+    factory_dir = tempfile.mkdtemp()
+    database_uri = 'sqlite:///' + os.path.join(factory_dir, 'factory.db')
+
+    try:
+        print("\n1️⃣ Config overrides are applied on top of the defaults...")
+        api_app = create_app({'SQLALCHEMY_DATABASE_URI': database_uri, 'USAGE_RETENTION_MONTHS': 6}, blueprints=['api'])
+        assert api_app.config['USAGE_RETENTION_MONTHS'] == 6
+        assert api_app.config['VACUUM_PAGES_PER_RUN'] == app.config['VACUUM_PAGES_PER_RUN']
+        print("   ✅ Override applied, other defaults kept")
+
+        print("\n2️⃣ Only the requested blueprints are registered...")
+        assert set(api_app.blueprints) == {'api'}
+        assert list(api_app.extensions['boot_report']['blueprint_ms']) == ['api']
+        with api_app.app_context():
+            initialize_database()
+        with api_app.test_client() as client:
+            data = client.get('/api/cards').get_json()
+            assert data['success'] and data['cards'], data
+            assert client.get('/').status_code == 404
+        print(f"   ✅ /api/cards served {len(data['cards'])} seeded cards, / is not registered")
+
+        print("\n3️⃣ Unknown blueprints are refused...")
+        try:
+            create_app(blueprints=['admin'])
+            assert False, 'expected a ValueError'
+        except ValueError as e:
+            assert 'admin' in str(e), e
+        print("   ✅ Refused with a clear error")
+
+        print("\n4️⃣ The default app has every route group...")
+        assert set(app.blueprints) == set(BLUEPRINTS)
+        with app.test_client() as client:
+            assert client.get('/').status_code == 200
+        print(f"   ✅ {', '.join(app.blueprints)}")
+
+        print("\n5️⃣ Each app keeps its own usage writer and caches...")
+        for name in ('usage_writer', 'valuations', 'forecasts', 'dashboard_pages'):
+            assert api_app.extensions[name] is not app.extensions[name], name
+        assert api_app.extensions['usage_writer'].app is api_app
+        with api_app.app_context():
+            # A Core update doesn't bump the wallet version, so only a cache shared across apps could hide it
+            db.session.execute(db.update(CardEnhanced).where(CardEnhanced.id == 1).values(name='Factory Only Card'))
+            db.session.commit()
+        with api_app.test_client() as client:
+            names = {card['card_name'] for card in client.get('/api/valuation').get_json()['cards']}
+            assert 'Factory Only Card' in names
+        with app.test_client() as client:
+            names = {card['card_name'] for card in client.get('/api/valuation').get_json()['cards']}
+            assert 'Factory Only Card' not in names
+        print("   ✅ The default app doesn't see the factory app's valuation")
+
+        print("\n6️⃣ Without SECRET_KEY the session key is written when serving, not when the app is built...")
+        key_app = create_app({'SQLALCHEMY_DATABASE_URI': database_uri, 'SECRET_KEY': None}, blueprints=['api'])
+        key_app.instance_path = os.path.join(factory_dir, 'served')
+        key_path = os.path.join(key_app.instance_path, 'secret_key')
+        assert not os.path.exists(key_path)
+        with key_app.test_client() as client:
+            assert client.get('/api/cards').status_code == 200
+        with open(key_path) as key_file:
+            assert key_app.config['SECRET_KEY'] == key_file.read().strip()
+        cli_app = create_app({'SQLALCHEMY_DATABASE_URI': database_uri, 'SECRET_KEY': None}, blueprints=['api'])
+        cli_app.instance_path = os.path.join(factory_dir, 'cli')
+        result = cli_app.test_cli_runner().invoke(args=['secret-key'])
+        assert result.exit_code == 0 and os.path.exists(os.path.join(cli_app.instance_path, 'secret_key')), result.output
+        print("   ✅ Created by the first request, or by flask secret-key")
+
+        for factory_app in (api_app, key_app, cli_app):
+            with factory_app.app_context():
+                db.session.remove()
+                db.engine.dispose()
+    finally:
+        shutil.rmtree(factory_dir)
+
+if __name__ == "__main__":
+    test_app_factory()
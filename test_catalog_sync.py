@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Catalog Sync Test
+Checks that syncing a catalog only touches rows that differ, leaves user progress alone,
+that re-running an unchanged catalog is a no-op, that unchanged catalog files are skipped by hash,
+that a fresh database is filled with exactly what catalog.jsonl lists, and that a catalog change
+reaches every wallet.
+"""
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+from app import (app, db, create_app, create_tables, initialize_database, catalog_snapshot, create_wallet,
+                 current_wallet_id, wallet_context, sync_catalog_file_all_wallets, export_catalog, sync_catalog, sync_catalog_file, write_catalog_file,
+                 get_wallet_version, refresh_dashboard_items,
+                 CardEnhanced, CreditBenefit2, SpendingBonus, OtherBonus, CardBenefitSummary, CatalogState)
+
+def changed_rows(report):
+    """Total rows a sync report says were added, updated or deleted"""
+    return sum(sum(counts.values()) for counts in report.values())
+
+def test_catalog_sync():
+    """Test catalog sync against the current database"""
+    print("🧪 Testing catalog sync")
+    create_tables()
+
+    with app.app_context():
+        original = export_catalog()
+
+        print("\n1️⃣ An unchanged catalog is a no-op...")
+        version = get_wallet_version()
+        assert changed_rows(sync_catalog(original)) == 0
+        assert get_wallet_version() == version
+        print("   ✅ Nothing written, wallet version unchanged")
+
+        catalog = copy.deepcopy(original)
+        card_entry = catalog[0]
+        card = CardEnhanced.query.filter_by(name=card_entry['name']).one()
+        credit_entry = card_entry['credits'][0]
+        credit = CreditBenefit2.query.filter_by(card_id=card.id, benefit_name=credit_entry['benefit_name']).one()
+        bonus = SpendingBonus.query.filter_by(card_id=card.id).first()
+        progress_before = (credit.current_amount, bonus.current_spend if bonus else None)
+
+        try:
+            print("\n2️⃣ Changed and new entries are applied...")
+            credit_entry['credit_amount'] += 1.0
+            card_entry['credits'].append({
+                'benefit_name': 'Catalog Test Credit', 'credit_amount': 15.0,
+                'description': 'Catalog test credit', 'frequency': 'monthly'
+            })
+            catalog.append({
+                'name': 'Catalog Test Card', 'issuer': 'Test Bank', 'annual_fee': 0.0,
+                'credits': [{'benefit_name': 'Welcome Credit', 'credit_amount': 50.0,
+                             'description': 'Catalog test', 'frequency': 'annual'}]
+            })
+            report = sync_catalog(catalog)
+            assert report['cards'] == {'inserted': 1, 'updated': 0, 'deleted': 0}, report
+            assert report['credits'] == {'inserted': 2, 'updated': 1, 'deleted': 0}, report
+            db.session.expire_all()
+            assert credit.credit_amount == credit_entry['credit_amount']
+            assert (credit.current_amount, bonus.current_spend if bonus else None) == progress_before
+            assert get_wallet_version() > version and credit.row_version == get_wallet_version()
+            new_card = CardEnhanced.query.filter_by(name='Catalog Test Card').one()
+            assert db.session.get(CardBenefitSummary, new_card.id).credit_count == 1
+            print("   ✅ 1 card and 2 credits added, 1 credit updated, progress untouched")
+
+            print("\n3️⃣ Running it again changes nothing...")
+            assert changed_rows(sync_catalog(catalog)) == 0
+            print("   ✅ Second sync was a no-op")
+
+            print("\n4️⃣ Pruning removes entries the catalog dropped...")
+            card_entry['credits'].pop()
+            assert sync_catalog(catalog, dry_run=True)['credits']['deleted'] == 0
+            report = sync_catalog(catalog, prune=True, dry_run=True)
+            assert report['credits']['deleted'] == 1
+            assert CreditBenefit2.query.filter_by(benefit_name='Catalog Test Credit').count() == 1
+            sync_catalog(catalog, prune=True)
+            assert CreditBenefit2.query.filter_by(benefit_name='Catalog Test Credit').count() == 0
+            print("   ✅ Dry run reported it, prune deleted it")
+        finally:
+            sync_catalog(original, prune=True)
+            new_card = CardEnhanced.query.filter_by(name='Catalog Test Card').first()
+            if new_card:
+                test_credit_ids = [test_credit.id for test_credit in new_card.credit_benefits]
+                for test_credit in new_card.credit_benefits:
+                    db.session.delete(test_credit)
+                db.session.delete(new_card)
+                db.session.flush()
+                refresh_dashboard_items(credit_ids=test_credit_ids)
+                db.session.commit()
+            CreditBenefit2.query.filter_by(benefit_name='Catalog Test Credit').delete()
+            db.session.commit()
+
+        assert changed_rows(sync_catalog(original)) == 0
+
+def test_catalog_file():
+    """Test the catalog file format and the skip-if-unchanged hash check"""
+    print("🧪 Testing catalog files")
+    create_tables()
+
+    with app.app_context():
+        catalog_dir = tempfile.mkdtemp()
+        path = os.path.join(catalog_dir, 'catalog-test.jsonl')
+        try:
+            print("\n1️⃣ The first sync records the file's hash...")
+            write_catalog_file(path, export_catalog())
+            assert changed_rows(sync_catalog_file(path)) == 0
+            assert len(db.session.get(CatalogState, (current_wallet_id(), 'catalog-test.jsonl')).content_hash) == 64
+            print("   ✅ Hash stored")
+
+            print("\n2️⃣ An unchanged file is skipped without parsing...")
+            assert sync_catalog_file(path) is None
+            assert sync_catalog_file(path, force=True) is not None
+            print("   ✅ Skipped, and --force still syncs")
+
+            print("\n3️⃣ Bad files are rejected with their line number...")
+            with open(path, encoding='utf-8') as catalog_file:
+                typo_line = sum(1 for _ in catalog_file) + 1
+            with open(path, 'a', encoding='utf-8') as catalog_file:
+                catalog_file.write(json.dumps({'name': 'Typo Card', 'credits': [{'benefit_name': 'X', 'amount': 5}]}) + '\n')
+            try:
+                sync_catalog_file(path)
+                assert False, 'expected a ValueError'
+            except ValueError as e:
+                assert f'line {typo_line}' in str(e) and 'amount' in str(e), e
+            with open(path, 'w', encoding='utf-8') as catalog_file:
+                catalog_file.write(json.dumps({'format': 'card-catalog', 'version': 99}) + '\n')
+            try:
+                sync_catalog_file(path)
+                assert False, 'expected a ValueError'
+            except ValueError as e:
+                assert 'version 99' in str(e), e
+            assert not CardEnhanced.query.filter_by(name='Typo Card').first()
+            print("   ✅ Unknown field and unsupported version both rejected")
+        finally:
+            CatalogState.query.filter_by(source='catalog-test.jsonl').delete()
+            db.session.commit()
+            os.remove(path)
+            os.rmdir(catalog_dir)
+
+def test_catalog_fresh_database():
+    """Test that a new database gets the catalog's threshold bonuses and cards"""
+    print("🧪 Testing the catalog on a fresh database")
+    fresh_dir = tempfile.mkdtemp()
+    fresh_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(fresh_dir, 'fresh.db'),
+    }, blueprints=['api'])
+
+    try:
+        with fresh_app.app_context():
+            initialize_database()
+
+            print("\n1️⃣ Threshold bonuses are created...")
+            bonuses = {(bonus.card.name, bonus.description, bonus.required_spend): bonus
+                       for bonus in OtherBonus.query.filter_by(bonus_type='threshold')}
+            assert len(bonuses) == 20, len(bonuses)
+            southwest = bonuses[('Chase Sapphire Reserve', 'Southwest Airlines credit', 75000.0)]
+            assert southwest.bonus_amount == '$500' and southwest.status == 'pending'
+            assert ('Chase Sapphire Reserve', 'Shops at Chase credit', 75000.0) in bonuses
+            assert ('Capital One VentureX', 'Anniversary miles', 0.0) in bonuses
+            assert ('World of Hyatt', 'Second free night at Category 1-4 Hyatt hotel', 15000.0) in bonuses
+            assert ('Hilton Honors Aspire', 'Additional Free Night Reward', 60000.0) in bonuses
+            print(f"   ✅ {len(bonuses)} threshold bonuses")
+
+            print("\n2️⃣ Cards and credits only the old scripts added are created...")
+            catalog_names = {card['name'] for card in catalog_snapshot(fresh_app.config['CATALOG_PATH'])}
+            assert {card.name for card in CardEnhanced.query.all()} == catalog_names
+            platinum = CardEnhanced.query.filter_by(name='American Express Platinum').one()
+            assert len(platinum.credit_benefits) == 13
+            assert CardEnhanced.query.filter_by(name='Hilton Honors American Express Card').one().signup_bonuses
+            assert CreditBenefit2.query.filter_by(benefit_name='Checked Bags').count() == 1
+            print("   ✅ American Express Platinum, Hilton Honors American Express Card and their benefits")
+
+            print("\n3️⃣ A renewed bonus is the same catalog entry...")
+            southwest.status = 'completed'
+            db.session.add(OtherBonus(card_id=southwest.card_id, bonus_type='threshold', bonus_amount='$500',
+                                      description=southwest.description, required_spend=75000.0,
+                                      frequency=southwest.frequency, status='pending'))
+            db.session.commit()
+            report = sync_catalog_file(fresh_app.config['CATALOG_PATH'], force=True)
+            assert changed_rows(report) == 0, report
+            assert changed_rows(sync_catalog(export_catalog(), prune=True)) == 0
+            assert OtherBonus.query.filter_by(description='Southwest Airlines credit').count() == 2
+            print("   ✅ No duplicate inserted, nothing pruned")
+    finally:
+        with fresh_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(fresh_dir)
+
+def test_catalog_every_wallet():
+    """Test that syncing a changed catalog file updates every wallet, each with its own hash"""
+    print("🧪 Testing catalog sync across wallets")
+    wallets_dir = tempfile.mkdtemp()
+    wallets_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(wallets_dir, 'wallets.db'),
+    }, blueprints=['api'])
+
+    try:
+        with wallets_app.app_context():
+            initialize_database()
+            second_wallet = create_wallet('Second wallet')
+            catalog = catalog_snapshot(wallets_app.config['CATALOG_PATH'])
+            path = os.path.join(wallets_dir, os.path.basename(wallets_app.config['CATALOG_PATH']))
+
+            print("\n1️⃣ Both wallets start on the current catalog...")
+            assert sync_catalog_file_all_wallets(wallets_app.config['CATALOG_PATH']) == {1: None, second_wallet: None}
+            print("   ✅ Both skipped by hash")
+
+            print("\n2️⃣ A changed annual fee reaches both wallets...")
+            changed = copy.deepcopy(catalog)
+            changed[0]['annual_fee'] = 999.0
+            write_catalog_file(path, changed)
+            reports = sync_catalog_file_all_wallets(path)
+            assert set(reports) == {1, second_wallet}
+            assert all(report['cards']['updated'] == 1 for report in reports.values()), reports
+            for wallet_id in (1, second_wallet):
+                with wallet_context(wallet_id):
+                    assert CardEnhanced.query.filter_by(name=changed[0]['name']).one().annual_fee == 999.0
+            print("   ✅ Annual fee is 999 in both wallets")
+
+            print("\n3️⃣ Each wallet records the hash it synced...")
+            assert sync_catalog_file_all_wallets(path) == {1: None, second_wallet: None}
+            print("   ✅ Second sync skipped in both wallets")
+    finally:
+        with wallets_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(wallets_dir)
+
+if __name__ == "__main__":
+    test_catalog_sync()
+    test_catalog_file()
+    test_catalog_fresh_database()
+    test_catalog_every_wallet()
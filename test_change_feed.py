@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Change Feed Test
+Checks that changed rows get a new row_version and that /api/changes
+returns only what changed since a version, including deletes.
+"""
+
+from app import app, db, create_tables, CardEnhanced, CreditBenefit2
+
+def test_change_feed():
+    """Test row versions and /api/changes"""
+    print("🧪 Testing change feed")
+    create_tables()
+
+    with app.app_context(), app.test_client() as client:
+        print("\n1️⃣ A full sync returns every row...")
+        full = client.get('/api/changes').get_json()
+        assert full['success']
+        assert len(full['changes']['cards']) == CardEnhanced.query.count()
+        version = full['version']
+        print(f"   ✅ {len(full['changes']['cards'])} cards and {len(full['changes']['credits'])} credits at version {version}")
+
+        print("\n2️⃣ Nothing changed means an empty delta...")
+        empty = client.get(f'/api/changes?since={version}').get_json()
+        assert all(not rows for rows in empty['changes'].values()) and not empty['deleted']
+        print("   ✅ Empty delta")
+
+        print("\n3️⃣ Adding, editing and deleting show up in the delta...")
+        card = CardEnhanced.query.first()
+        credit = CreditBenefit2(card_id=card.id, benefit_name='Change Feed Credit', credit_amount=5.0,
+                                description='Change feed test', frequency='monthly')
+        db.session.add(credit)
+        db.session.commit()
+        assert credit.row_version > version
+
+        added = client.get(f'/api/changes?since={version}').get_json()
+        assert [row['id'] for row in added['changes']['credits']] == [credit.id]
+        assert not added['changes']['cards']
+
+        credit.credit_amount = 6.0
+        db.session.commit()
+        edited = client.get(f"/api/changes?since={added['version']}").get_json()
+        assert edited['changes']['credits'][0]['credit_amount'] == 6.0
+
+        credit_id = credit.id
+        db.session.delete(credit)
+        db.session.commit()
+        removed = client.get(f"/api/changes?since={edited['version']}").get_json()
+        assert removed['deleted'] == [{'entity_type': 'credits', 'entity_id': credit_id, 'row_version': removed['version']}]
+        print("   ✅ Insert, update and tombstone each came through once")
+
+        print("\n4️⃣ Marking a credit used shows up as a status change...")
+        credit_row = full['changes']['credits'][0]
+        card_name = next(c['name'] for c in full['changes']['cards'] if c['id'] == credit_row['card_id'])
+        client.post('/mark-credit-used', json={
+            'type': credit_row['frequency'], 'card_name': card_name, 'identifier': credit_row['benefit_name']
+        })
+        statuses = client.get(f"/api/changes?since={removed['version']}").get_json()['changes']['credit_statuses']
+        assert statuses and statuses[0]['status'] == 'used'
+        client.post('/mark-credit-available', json={'card_name': card_name, 'identifier': credit_row['benefit_name']})
+        print("   ✅ Status change included")
+
+        assert client.get('/api/changes?since=-1').status_code == 400
+
+if __name__ == "__main__":
+    test_change_feed()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Materialized Dashboard Test
+Checks that the dashboard_item table shows the same credits and bonuses as the live queries,
+including after a credit is marked as used.
+"""
+
+from app import (app, create_tables, get_dashboard_sections, get_real_credits_by_frequency,
+                 get_used_credits_by_frequency, get_real_signup_bonuses)
+
+FREQUENCIES = ['annual', 'semi-annual', 'quarterly', 'monthly', 'onetime']
+
+def _assert_matches_live_queries():
+    sections = get_dashboard_sections()
+    for frequency in FREQUENCIES:
+        live = sorted((c['card_name'], c.get('benefit_name'), c['status']) for c in get_real_credits_by_frequency(frequency))
+        materialized = sorted((c.card_name, c.title, c.status) for c in sections[frequency])
+        assert live == materialized, frequency
+
+        live_used = sorted((c['card_name'], c.get('benefit_name')) for c in get_used_credits_by_frequency(frequency))
+        materialized_used = sorted((c.card_name, c.title) for c in sections[f'used-{frequency}'])
+        assert live_used == materialized_used, frequency
+
+    live_signups = sorted((b['card_name'], b['description']) for b in get_real_signup_bonuses())
+    assert live_signups == sorted((b.card_name, b.description) for b in sections['signup'])
+
+def test_dashboard_items():
+    """Compare materialized dashboard rows with the live queries"""
+    print("🧪 Testing materialized dashboard")
+    create_tables()
+
+    with app.app_context():
+        _assert_matches_live_queries()
+        print("   ✅ Dashboard rows match the live queries")
+
+        credits = get_real_credits_by_frequency('monthly')
+        if not credits:
+            return
+        credit = credits[0]
+
+        with app.test_client() as client:
+            client.post('/mark-credit-used', json={
+                'type': 'monthly', 'card_name': credit['card_name'], 'identifier': credit['benefit_name']
+            })
+            try:
+                _assert_matches_live_queries()
+                used = [c.title for c in get_dashboard_sections()['used-monthly']]
+                assert credit['benefit_name'] in used
+                print(f"   ✅ {credit['benefit_name']} moved to the used section")
+            finally:
+                client.post('/mark-credit-available', json={
+                    'card_name': credit['card_name'], 'identifier': credit['benefit_name']
+                })
+        _assert_matches_live_queries()
+
+        with app.test_client() as client:
+            assert client.get('/').status_code == 200
+            print("   ✅ Dashboard renders from the materialized rows")
+
+if __name__ == "__main__":
+    test_dashboard_items()
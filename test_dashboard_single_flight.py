@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Dashboard Single-Flight Test
+Checks that concurrent callers share one computation, that the dashboard is rendered once per wallet
+version, and that stale-while-revalidate serves the previous page while a background thread rebuilds.
+"""
+
+import time
+from threading import Thread, Barrier
+from app import (app, db, create_tables, dashboard_cache_key, SingleFlight,
+                 CardEnhanced, CreditBenefit2, CreditStatus)
+
+def test_single_flight():
+    """Test SingleFlight with a slow computation and eight callers"""
+    print("🧪 Testing single-flight calls")
+    flight = SingleFlight()
+    calls = []
+    results = []
+    barrier = Barrier(8)
+
+    def slow_compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    def caller():
+        barrier.wait()
+        results.append(flight.do('key', slow_compute))
+
+    threads = [Thread(target=caller) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1 and flight.leaders == 1 and flight.followers == 7
+    assert all(result is results[0] for result in results)
+    assert not flight.running('key')
+    print("   ✅ 8 callers, 1 computation, everyone got the same result")
+
+    def failing_compute():
+        raise ValueError('build failed')
+    try:
+        flight.do('broken', failing_compute)
+        assert False, 'expected a ValueError'
+    except ValueError as e:
+        assert str(e) == 'build failed'
+    assert not flight.running('broken')
+    print("   ✅ Errors reach the caller and don't leave the key stuck")
+
+def get_page(client):
+    response = client.get('/')
+    assert response.status_code == 200
+    return response.get_data(as_text=True)
+
+def test_dashboard_page_cache():
+    """Test the dashboard page cache against the current database"""
+    print("🧪 Testing dashboard page cache")
+    create_tables()
+    pages = app.extensions['dashboard_pages']
+    builds = app.extensions['dashboard_builds']
+
+    with app.app_context(), app.test_client() as client:
+        print("\n1️⃣ The page is built once, then reused...")
+        get_page(client)  # Let any lazy credit resets settle first
+        pages.clear()
+        leaders = builds.leaders
+        page = get_page(client)
+        assert builds.leaders == leaders + 1
+        assert get_page(client) == page and builds.leaders == leaders + 1
+        print("   ✅ Second request served from the cache")
+
+        print("\n2️⃣ Concurrent cold requests share one build...")
+        pages.clear()
+        leaders = builds.leaders
+        barrier = Barrier(6)
+        responses = []
+
+        def request_page():
+            with app.test_client() as thread_client:
+                barrier.wait()
+                responses.append(get_page(thread_client))
+
+        threads = [Thread(target=request_page) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert builds.leaders == leaders + 1, builds.leaders - leaders
+        assert responses == [page] * 6
+        print(f"   ✅ 6 requests, 1 build ({builds.followers} requests have waited on a build so far)")
+
+        print("\n3️⃣ Stale-while-revalidate serves the old page during the rebuild...")
+        credit = CreditBenefit2.query.join(CardEnhanced).filter(
+            CreditBenefit2.frequency == 'monthly', CreditBenefit2.benefit_name != None
+        ).first()
+        card_name = credit.card.name
+        had_status = CreditStatus.query.filter_by(card_name=card_name, credit_type='monthly',
+                                                  credit_identifier=credit.benefit_name).first() is not None
+        app.config['DASHBOARD_STALE_WHILE_REVALIDATE'] = True
+        try:
+            assert client.post('/mark-credit-used', json={
+                'type': 'monthly', 'card_name': card_name, 'identifier': credit.benefit_name
+            }).get_json()['success']
+            assert get_page(client) == page  # Previous page, straight away
+
+            deadline = time.monotonic() + 10
+            while not pages.get(dashboard_cache_key())[0]:
+                assert time.monotonic() < deadline, 'background rebuild never finished'
+                time.sleep(0.05)
+            new_page = get_page(client)
+            assert new_page != page
+            print("   ✅ Old page served at once, new page ready after the background rebuild")
+        finally:
+            app.config['DASHBOARD_STALE_WHILE_REVALIDATE'] = False
+            client.post('/mark-credit-available', json={'card_name': card_name, 'identifier': credit.benefit_name})
+            if not had_status:
+                db.session.delete(CreditStatus.query.filter_by(card_name=card_name, credit_type='monthly',
+                                                               credit_identifier=credit.benefit_name).one())
+                db.session.commit()
+        assert get_page(client) == page
+
+if __name__ == "__main__":
+    test_single_flight()
+    test_dashboard_page_cache()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Scheduled Job Ledger Test
+Checks that each job runs exactly once per period and that failed runs are retried.
+"""
+
+from app import app, db, create_tables, run_scheduled_job, ScheduledJobRun
+
+def test_job_ledger():
+    """Test run_scheduled_job and /debug/jobs"""
+    print("🧪 Testing scheduled job ledger")
+    create_tables()
+
+    job_name = 'ledger_test_job'
+    calls = []
+
+    def working_job():
+        calls.append('ran')
+
+    def failing_job():
+        raise RuntimeError('boom')
+
+    try:
+        print("\n1️⃣ A job runs once per period...")
+        assert run_scheduled_job(job_name, working_job, '2026-01-01') is True
+        assert run_scheduled_job(job_name, working_job, '2026-01-01') is False
+        assert run_scheduled_job(job_name, working_job, '2026-01-02') is True
+        assert len(calls) == 2
+        print("   ✅ Second run in the same period was skipped")
+
+        print("\n2️⃣ Failed runs are recorded and retried...")
+        assert run_scheduled_job(job_name, failing_job, '2026-01-03') is False
+        with app.app_context():
+            failed = ScheduledJobRun.query.filter_by(job_name=job_name, period_key='2026-01-03').first()
+            assert failed.status == 'failed' and 'boom' in failed.error
+            assert failed.duration_ms is not None
+        assert run_scheduled_job(job_name, working_job, '2026-01-03') is True
+        print("   ✅ Failed run was retried successfully")
+
+        print("\n3️⃣ /debug/jobs shows the scheduler's jobs...")
+        with app.test_client() as client:
+            response = client.get('/debug/jobs')
+            assert response.status_code == 200
+            names = [job['job_name'] for job in response.get_json()['jobs']]
+            assert 'reset_expired_credits' in names and 'reset_annual_spending_bonuses' in names
+            print(f"   ✅ Jobs listed: {', '.join(names)}")
+    finally:
+        with app.app_context():
+            ScheduledJobRun.query.filter_by(job_name=job_name).delete()
+            db.session.commit()
+
+if __name__ == "__main__":
+    test_job_ledger()
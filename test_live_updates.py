@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Live Updates Test
+Checks that /api/events pushes wallet changes to an open stream as soon as they commit.
+"""
+
+import json
+import time
+from threading import Thread
+from app import app, create_tables, get_real_credits_by_frequency, wallet_event_broker
+
+def _next_wallet_message(stream):
+    """Read chunks until a wallet event arrives (skipping the retry line and keepalives)"""
+    for chunk in stream:
+        text = chunk.decode()
+        if text.startswith('id:'):
+            data_line = next(line for line in text.splitlines() if line.startswith('data: '))
+            return json.loads(data_line[len('data: '):])
+    return None
+
+def _post_in_background(path, payload):
+    """Send a request from another thread, the way a second browser tab would"""
+    def send():
+        with app.test_client() as other_client:
+            other_client.post(path, json=payload)
+    worker = Thread(target=send)
+    worker.start()
+    return worker
+
+def test_live_updates():
+    """Test /api/events"""
+    print("🧪 Testing live wallet updates")
+    create_tables()
+    poll_seconds = app.config['SSE_POLL_SECONDS']
+    app.config['SSE_POLL_SECONDS'] = 1  # Restored below; the module-level app is shared with other tests
+    try:
+        with app.app_context():
+            credit = get_real_credits_by_frequency('monthly')[0]
+
+        with app.test_client() as client:
+            response = client.get('/api/events', buffered=False)
+            assert response.mimetype == 'text/event-stream'
+            stream = iter(response.response)
+            assert next(stream).startswith(b'retry:')
+
+            try:
+                print("\n1️⃣ A change made after connecting is pushed to the stream...")
+                started = time.perf_counter()
+                worker = _post_in_background('/mark-credit-used', {
+                    'type': 'monthly', 'card_name': credit['card_name'], 'identifier': credit['benefit_name']
+                })
+                message = _next_wallet_message(stream)
+                worker.join()
+                assert message['event_type'] == 'credit_used'
+                print(f"   ✅ Received {message['event_type']} after {(time.perf_counter() - started) * 1000:.0f}ms")
+            finally:
+                response.close()
+
+            print("\n2️⃣ Streams resume from Last-Event-ID...")
+            _post_in_background('/mark-credit-available', {
+                'card_name': credit['card_name'], 'identifier': credit['benefit_name']
+            }).join()
+            resumed = client.get('/api/events', headers={'Last-Event-ID': str(message['id'])}, buffered=False)
+            try:
+                resumed_stream = iter(resumed.response)
+                next(resumed_stream)
+                missed = _next_wallet_message(resumed_stream)
+                assert missed['id'] > message['id'] and missed['event_type'] == 'credit_available'
+                print("   ✅ Reconnected stream caught up on the missed change")
+            finally:
+                resumed.close()
+
+        assert not wallet_event_broker._subscribers
+        print("   ✅ Closed streams unsubscribe from the broker")
+    finally:
+        app.config['SSE_POLL_SECONDS'] = poll_seconds
+
+if __name__ == "__main__":
+    test_live_updates()
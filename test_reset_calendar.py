@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Reset Calendar Test
+Checks that reset windows are worked out correctly for any date, including stale reset dates
+and reset dates stored as the last day of a period.
+"""
+
+import datetime
+from reset_calendar import credit_window, current_windows, period_months
+from app import calculate_next_reset_date
+
+def test_reset_calendar():
+    """Test calendar, anniversary and every-4-years reset windows"""
+    print("🧪 Testing reset calendar")
+    today = datetime.date(2026, 10, 19)
+
+    print("\n1️⃣ Calendar periods (no reset date)...")
+    assert credit_window(None, 'monthly', on_date=today) == (datetime.date(2026, 10, 1), datetime.date(2026, 11, 1))
+    assert credit_window(None, 'quarterly', on_date=today) == (datetime.date(2026, 10, 1), datetime.date(2027, 1, 1))
+    assert credit_window(None, 'semi-annual', on_date=today) == (datetime.date(2026, 7, 1), datetime.date(2027, 1, 1))
+    assert credit_window(None, 'annual', on_date=today) == (datetime.date(2026, 1, 1), datetime.date(2027, 1, 1))
+    print("   ✅ Month, quarter, half and year windows line up with the calendar")
+
+    print("\n2️⃣ Stale reset dates catch up in one step...")
+    # A monthly credit whose reset date is more than a year and a half out of date
+    assert credit_window(datetime.date(2025, 2, 1), 'monthly', on_date=today) == (datetime.date(2026, 10, 1), datetime.date(2026, 11, 1))
+    # A quarter-end reset date is the end of a calendar quarter, so the quarters start on the 1st
+    assert credit_window(datetime.date(2025, 3, 31), 'quarterly', on_date=today) == (datetime.date(2026, 10, 1), datetime.date(2027, 1, 1))
+    print("   ✅ Stale monthly and quarterly credits jump straight to the current period")
+
+    print("\n2️⃣b Reset dates on the last day of a period...")
+    year_end = datetime.date(2025, 12, 31)
+    assert credit_window(year_end, 'annual', on_date=today) == (datetime.date(2026, 1, 1), datetime.date(2027, 1, 1))
+    # Using it on Dec 31 counts for 2025, so it is available again from Jan 1
+    assert credit_window(year_end, 'annual', on_date=year_end) == (datetime.date(2025, 1, 1), datetime.date(2026, 1, 1))
+    assert credit_window(year_end, 'annual', on_date=datetime.date(2026, 1, 1))[0] == datetime.date(2026, 1, 1)
+    assert credit_window(datetime.date(2025, 6, 30), 'semi-annual', on_date=today) == (datetime.date(2026, 7, 1), datetime.date(2027, 1, 1))
+    assert credit_window(datetime.date(2025, 2, 28), 'monthly', on_date=today) == (datetime.date(2026, 10, 1), datetime.date(2026, 11, 1))
+    # Month ends that aren't the end of a period of that length are anniversaries
+    assert credit_window(datetime.date(2025, 8, 31), 'annual', on_date=today) == (datetime.date(2026, 8, 31), datetime.date(2027, 8, 31))
+    assert credit_window(datetime.date(2025, 4, 30), 'quarterly', on_date=today) == (datetime.date(2026, 7, 30), datetime.date(2026, 10, 30))
+    # Stored period ends move to the end of the current period, and only once they have passed
+    assert calculate_next_reset_date(year_end, 'annual', datetime.date(2026, 1, 1)) == datetime.date(2026, 12, 31)
+    assert calculate_next_reset_date(datetime.date(2025, 3, 31), 'quarterly', today) == datetime.date(2026, 12, 31)
+    assert calculate_next_reset_date(datetime.date(2025, 2, 1), 'monthly', today) == datetime.date(2026, 11, 1)
+    print("   ✅ Period-end dates follow the calendar; other dates stay anniversaries")
+
+    print("\n3️⃣ Cardmember-year anniversaries...")
+    assert credit_window(datetime.date(2025, 8, 15), 'annual', on_date=today) == (datetime.date(2026, 8, 15), datetime.date(2027, 8, 15))
+    # A reset date in the future means we're in the period just before it
+    assert credit_window(datetime.date(2027, 8, 15), 'annual', on_date=today) == (datetime.date(2026, 8, 15), datetime.date(2027, 8, 15))
+    print("   ✅ Anniversary windows follow the card's reset date")
+
+    print("\n4️⃣ Every 4 years and one-time credits...")
+    assert period_months('onetime', '$120 TSA PreCheck/Global Entry credit (every 4 years)') == 48
+    assert credit_window(datetime.date(2024, 3, 1), 'onetime', 'Global Entry credit (every 4 years)', today) == (datetime.date(2024, 3, 1), datetime.date(2028, 3, 1))
+    assert credit_window(datetime.date(2025, 1, 1), 'onetime', 'Hotel upgrade reward', today) is None
+    print("   ✅ Global Entry credits reset every 4 years; other one-time credits never reset")
+
+    print("\n5️⃣ Many credits at once...")
+    schedules = [(datetime.date(2025, 2, 1), 'monthly', '')] * 50 + [(None, 'annual', ''), (None, 'onetime', '')]
+    windows = current_windows(schedules, today)
+    assert len(windows) == 52
+    assert windows[0] == windows[49] == (datetime.date(2026, 10, 1), datetime.date(2026, 11, 1))
+    assert windows[50] == (datetime.date(2026, 1, 1), datetime.date(2027, 1, 1))
+    assert windows[51] is None
+    print("   ✅ Windows come back in the same order as the credits")
+
+if __name__ == "__main__":
+    test_reset_calendar()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Full-Text Search Test
+Checks that /api/search finds benefits by words in their descriptions, that the search index
+follows inserts, updates and deletes, and that stored text comes back HTML-escaped.
+"""
+
+from app import app, db, create_tables, CardEnhanced, CreditBenefit2
+
+def _search(client, text):
+    return client.get(f'/api/search?q={text}&type=credit').get_json()['results']
+
+def test_search():
+    """Test /api/search and the FTS sync triggers"""
+    print("🧪 Testing full-text search")
+    create_tables()
+
+    with app.app_context(), app.test_client() as client:
+        card = CardEnhanced.query.first()
+        credit = CreditBenefit2(card_id=card.id, benefit_name='Search Test Credit', credit_amount=10.0,
+                                description='Statement credits for Zyxgrub, The Qwerty Factory, Goldbelly',
+                                frequency='monthly')
+        db.session.add(credit)
+        db.session.commit()
+
+        try:
+            print("\n1️⃣ New credits are searchable straight away...")
+            results = _search(client, 'zyxgrub')
+            assert [result['id'] for result in results] == [credit.id]
+            assert results[0]['card_name'] == card.name
+            assert '<mark>Zyxgrub</mark>' in results[0]['snippet']
+            print(f"   ✅ Found on {results[0]['card_name']}: {results[0]['snippet']}")
+
+            print("\n2️⃣ Prefixes and multiple words match...")
+            assert _search(client, 'zyxg')[0]['id'] == credit.id
+            assert _search(client, 'qwerty factory')[0]['id'] == credit.id
+            assert not _search(client, 'qwerty nomatchword')
+            print("   ✅ Prefix and all-words matching work")
+
+            print("\n3️⃣ Updates and deletes keep the index in sync...")
+            credit.description = 'Statement credits for Plokmart'
+            db.session.commit()
+            assert not _search(client, 'zyxgrub')
+            assert _search(client, 'plokmart')[0]['id'] == credit.id
+        finally:
+            db.session.delete(credit)
+            db.session.commit()
+        assert not _search(client, 'plokmart')
+        print("   ✅ Edited and removed credits drop out of the results")
+
+        print("\n4️⃣ Stored text is escaped, only the match markers are HTML...")
+        credit = CreditBenefit2(card_id=card.id, benefit_name='<img src=x onerror=alert(1)> Credit', credit_amount=1.0,
+                                description='Zyxscript <script>alert("x")</script> & more', frequency='monthly')
+        db.session.add(credit)
+        db.session.commit()
+        try:
+            result = _search(client, 'zyxscript')[0]
+            assert '<script>' not in result['snippet'] and '&lt;script&gt;' in result['snippet']
+            assert '<mark>Zyxscript</mark>' in result['snippet'] and '&amp; more' in result['snippet']
+            assert result['title'].startswith('&lt;img src=x onerror=alert(1)&gt;')
+            print(f"   ✅ {result['snippet']}")
+        finally:
+            db.session.delete(credit)
+            db.session.commit()
+
+        print("\n5️⃣ Bad requests are rejected...")
+        assert client.get('/api/search').status_code == 400
+        assert client.get('/api/search?q=dining&type=nope').status_code == 400
+        assert client.get('/api/search?q="(*').get_json()['count'] == 0
+        print("   ✅ Missing text, unknown types and stray punctuation handled")
+
+if __name__ == "__main__":
+    test_search()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Seed Data Test
+Checks that seed_data.json bulk loads the legacy tables of a brand new database with every row and
+relationship intact, and that a seed file written for a different schema version is refused.
+"""
+
+import json
+import os
+import tempfile
+from flask import Flask
+from app import (db, SEED_SCHEMA_VERSION, SEED_TABLES, SEED_DATA_PATH, load_seed_tables,
+                 CreditBenefit, MultiplierBenefit, Card)
+
+def test_seed_data():
+    """Test the bulk seed loader against a throwaway database"""
+    print("🧪 Testing seed data")
+    seed_dir = tempfile.mkdtemp()
+    seed_app = Flask('seed_test')
+    seed_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(seed_dir, 'seed.db')
+    db.init_app(seed_app)
+
+    with open(SEED_DATA_PATH, encoding='utf-8') as seed_file:
+        seed = json.load(seed_file)
+
+    try:
+        with seed_app.app_context():
+            db.create_all()
+
+            print("\n1️⃣ Every seeded table loads in full...")
+            loaded = load_seed_tables(SEED_TABLES)
+            db.session.commit()
+            for table_name in SEED_TABLES:
+                assert loaded[table_name] == len(seed['tables'][table_name]['rows']), table_name
+            print(f"   ✅ {sum(loaded.values())} rows across {len(loaded)} tables")
+
+            print("\n2️⃣ Relationships line up...")
+            card_ids = {card.id for card in Card.query.all()}
+            assert all(benefit.card_id in card_ids for benefit in MultiplierBenefit.query.all())
+            assert all(benefit.card_id in card_ids for benefit in CreditBenefit.query.all())
+            assert CreditBenefit.query.count() == loaded['credit_benefit']
+            print("   ✅ Every benefit points at a seeded card")
+
+            print("\n3️⃣ A seed file for another schema version is refused...")
+            stale_path = os.path.join(seed_dir, 'stale.json')
+            with open(stale_path, 'w', encoding='utf-8') as stale_file:
+                json.dump(dict(seed, schema_version=SEED_SCHEMA_VERSION + 1), stale_file)
+            try:
+                load_seed_tables(['card'], path=stale_path)
+                assert False, 'expected a ValueError'
+            except ValueError as e:
+                assert 'schema version' in str(e), e
+            print("   ✅ Refused with a clear error")
+
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        for file_name in os.listdir(seed_dir):
+            os.remove(os.path.join(seed_dir, file_name))
+        os.rmdir(seed_dir)
+
+if __name__ == "__main__":
+    test_seed_data()
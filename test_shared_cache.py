@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Shared Cache Test
+Checks that values stored by one process are read by another, that bumping the generation drops
+everything, that a full cache starts over instead of failing, that a file is never resized under its
+users or opened when other users could have written it, and that an app with SHARED_CACHE_PATH keeps
+its dashboards and catalog snapshot there without sharing them with apps on other databases.
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+from shared_cache import SharedCache
+from app import create_app, db, initialize_database, create_wallet, catalog_snapshot, CardEnhanced
+
+def store_from_child(path):
+    cache = SharedCache(path, size=1024 * 1024, slots=64)
+    cache.set('from-child', {'pid': os.getpid()})
+    cache.close()
+
+def test_shared_cache():
+    """Test SharedCache on its own"""
+    print("🧪 Testing shared cache")
+    cache_dir = tempfile.mkdtemp()
+    path = os.path.join(cache_dir, 'cache.bin')
+    cache = SharedCache(path, size=1024 * 1024, slots=64)
+
+    try:
+        print("\n1️⃣ Values are shared between processes...")
+        assert cache.set('x', {'x': 1}) and cache.get('x') == {'x': 1}
+        assert cache.get('missing') is None
+        child = multiprocessing.get_context('fork').Process(target=store_from_child, args=(path,))
+        child.start()
+        child.join()
+        assert child.exitcode == 0
+        assert cache.get('from-child') == {'pid': child.pid}
+        print("   ✅ A value stored by another process was read from the mapping")
+
+        print("\n2️⃣ Bumping the generation drops everything...")
+        generation = cache.generation
+        assert cache.invalidate() == generation + 1
+        assert cache.get('x') is None and cache.get('from-child') is None
+        assert cache.stats()['bytes_used'] == 0
+        print(f"   ✅ Generation {cache.generation}, nothing left")
+
+        print("\n3️⃣ A full cache starts over instead of failing...")
+        generation = cache.generation
+        for index in range(100):  # More keys than slots, and more bytes than the data area
+            assert cache.set(f'key-{index}', 'v' * 20000)
+        assert cache.generation > generation
+        assert cache.get('key-99') == 'v' * 20000
+        assert not cache.set('huge', b'x' * 2 * 1024 * 1024)
+        print(f"   ✅ Reset to generation {cache.generation}, the latest value is still there")
+
+        print("\n4️⃣ Opening the file with another size or slot count is refused...")
+        for size, slots in ((2 * 1024 * 1024, 64), (1024 * 1024, 128)):
+            try:
+                SharedCache(path, size=size, slots=slots)
+                assert False, 'expected a ValueError'
+            except ValueError as e:
+                assert 'every app sharing it' in str(e), e
+        assert os.path.getsize(path) == 1024 * 1024
+        assert cache.get('key-99') == 'v' * 20000
+        print("   ✅ Refused, and the file was left as it was")
+
+        print("\n5️⃣ Files other users could have written are refused...")
+        assert os.stat(path).st_mode & 0o777 == 0o600 and os.stat(path + '.lock').st_mode & 0o777 == 0o600
+        planted = os.path.join(cache_dir, 'planted.bin')
+        linked = os.path.join(cache_dir, 'linked.bin')
+        with open(planted, 'wb'):
+            pass
+        os.chmod(planted, 0o666)
+        os.symlink(path, linked)
+        for unsafe_path in (planted, linked):
+            try:
+                SharedCache(unsafe_path, size=1024 * 1024, slots=64)
+                assert False, 'expected a PermissionError'
+            except PermissionError:
+                pass
+        assert os.path.getsize(planted) == 0
+        if os.getuid() == 0:
+            os.chmod(planted, 0o600)
+            os.chown(planted, 12345, -1)
+            try:
+                SharedCache(planted, size=1024 * 1024, slots=64)
+                assert False, 'expected a PermissionError'
+            except PermissionError as e:
+                assert 'another user' in str(e), e
+        print("   ✅ World-writable files, symlinks and other users' files are refused")
+    finally:
+        cache.close()
+        shutil.rmtree(cache_dir)
+
+def test_shared_cache_app():
+    """Test an app that keeps its caches in a shared file"""
+    print("🧪 Testing an app with SHARED_CACHE_PATH")
+    app_dir = tempfile.mkdtemp()
+    config = {
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(app_dir, 'wallets.db'),
+        'SHARED_CACHE_PATH': os.path.join(app_dir, 'cache.bin'),
+        'SHARED_CACHE_SIZE_MB': 8,
+    }
+    first_app = create_app(config)
+    second_app = create_app(config)  # Stands in for a second worker process
+    other_app = create_app(dict(config, SQLALCHEMY_DATABASE_URI='sqlite:///' + os.path.join(app_dir, 'other.db')))
+    shared = first_app.extensions['shared_cache']
+
+    try:
+        with first_app.app_context():
+            initialize_database()
+
+        print("\n1️⃣ A dashboard built by one worker is served by the other...")
+        with first_app.test_client() as client:
+            page = client.get('/').get_data(as_text=True)
+        builds = second_app.extensions['dashboard_builds']
+        leaders = builds.leaders
+        with second_app.test_client() as client:
+            assert client.get('/').get_data(as_text=True) == page
+        assert builds.leaders == leaders
+        print("   ✅ The second worker didn't build the page")
+
+        print("\n2️⃣ The catalog is parsed once per file version...")
+        with second_app.app_context():
+            create_wallet('Second wallet')
+            catalog_path = second_app.config['CATALOG_PATH']
+            second_shared = second_app.extensions['shared_cache']
+            hits = second_shared.hits
+            assert catalog_snapshot(catalog_path) and second_shared.hits == hits + 1
+        print("   ✅ Catalog snapshot read from the shared cache")
+
+        print("\n3️⃣ Clearing one worker's cache clears every worker's...")
+        with second_app.app_context():
+            second_app.extensions['dashboard_pages'].clear()
+        with first_app.test_client() as client:
+            leaders = first_app.extensions['dashboard_builds'].leaders
+            assert client.get('/').get_data(as_text=True) == page
+            assert first_app.extensions['dashboard_builds'].leaders == leaders + 1
+        print(f"   ✅ Rebuilt after the clear (generation {shared.generation})")
+
+        print("\n4️⃣ An app on another database never gets these pages...")
+        with other_app.app_context():
+            initialize_database()
+            # Same wallet version as the first database, different data (a Core update doesn't bump the version)
+            db.session.execute(db.update(CardEnhanced).where(CardEnhanced.name == 'Chase Sapphire Reserve')
+                               .values(name='Other Database Card'))
+            db.session.commit()
+        with other_app.test_client() as client:
+            assert 'Other Database Card' in client.get('/').get_data(as_text=True)
+        assert other_app.extensions['dashboard_builds'].leaders == 1
+        print("   ✅ Built its own page from its own database")
+    finally:
+        for flask_app in (first_app, second_app, other_app):
+            with flask_app.app_context():
+                db.session.remove()
+                db.engine.dispose()
+            flask_app.extensions['shared_cache'].close()
+        shutil.rmtree(app_dir)
+
+if __name__ == "__main__":
+    test_shared_cache()
+    test_shared_cache_app()
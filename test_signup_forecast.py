@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Signup Bonus Forecast Test
+Checks the completion forecast math, that /api/forecast picks up new spend in both the velocity
+and the remaining spend, and that velocity averages over exactly FORECAST_WINDOW_DAYS days.
+"""
+
+import datetime
+from app import app, db, create_tables, forecast_signup_bonus, get_spend_velocity_by_card, Card, Usage
+
+def test_forecast_math():
+    """Test forecast_signup_bonus on its own"""
+    print("🧪 Testing forecast math")
+    today = datetime.date(2026, 1, 1)
+
+    on_track = forecast_signup_bonus(1, 'Card', 4000, 1000, datetime.date(2026, 1, 30), 200, today)
+    assert on_track['status'] == 'on_track'
+    assert on_track['projected_completion'] == '2026-01-16'  # $3,000 left at $200/day = 15 days
+    assert on_track['catch_up_daily_spend'] == 0
+    print("   ✅ On track: finishes January 16")
+
+    at_risk = forecast_signup_bonus(1, 'Card', 4000, 1000, datetime.date(2026, 1, 10), 50, today)
+    assert at_risk['status'] == 'at_risk'
+    assert at_risk['required_daily_spend'] == 300.0  # $3,000 over 10 days
+    assert at_risk['catch_up_daily_spend'] == 250.0
+    print("   ✅ At risk: needs $250/day more")
+
+    assert forecast_signup_bonus(1, 'Card', 4000, 1000, datetime.date(2025, 12, 1), 50, today)['status'] == 'missed'
+    assert forecast_signup_bonus(1, 'Card', 4000, 4000, datetime.date(2026, 1, 10), 0, today)['status'] == 'completed'
+    no_spend = forecast_signup_bonus(1, 'Card', 4000, 0, datetime.date(2026, 3, 1), 0, today)
+    assert no_spend['status'] == 'at_risk' and no_spend['projected_completion'] is None
+    print("   ✅ Missed, completed and no-spend cases")
+
+def test_forecast_api():
+    """Test /api/forecast and its cache"""
+    print("🧪 Testing /api/forecast")
+    create_tables()
+
+    with app.app_context(), app.test_client() as client:
+        first = client.get('/api/forecast').get_json()
+        assert first['success']
+        if not first['forecasts']:
+            print("   ⚠️ No unfinished signup bonuses to forecast")
+            return
+
+        forecast = first['forecasts'][0]
+        card = Card.query.filter_by(name=forecast['card_name']).first()
+        if not card:
+            print(f"   ⚠️ No usage card named {forecast['card_name']}")
+            return
+
+        response = client.post('/api/usage', json={
+            'card_id': card.id, 'benefit_type': 'multiplier', 'benefit_id': 0,
+            'amount': 300.0, 'description': 'Forecast test purchase'
+        })
+        usage_id = response.get_json()['usage_id']
+        try:
+            second = client.get('/api/forecast').get_json()
+            updated = next(f for f in second['forecasts'] if f['signup_bonus_id'] == forecast['signup_bonus_id'])
+            window_days = second['window_days']
+            assert abs(updated['daily_velocity'] - forecast['daily_velocity'] - 300.0 / window_days) < 0.02
+            print(f"   ✅ New purchase raised {card.name}'s velocity to ${updated['daily_velocity']}/day")
+            assert updated['remaining_spend'] == max(0.0, round(forecast['remaining_spend'] - 300.0, 2))
+            print(f"   ✅ ...and brought the remaining spend down to ${updated['remaining_spend']}")
+        finally:
+            db.session.delete(db.session.get(Usage, usage_id))
+            db.session.commit()
+
+def test_velocity_window():
+    """Purchases from exactly FORECAST_WINDOW_DAYS days ago fall just outside the window"""
+    print("🧪 Testing the velocity window")
+    create_tables()
+
+    with app.app_context():
+        card = Card.query.first()
+        today = datetime.date.today()
+        window_days = app.config['FORECAST_WINDOW_DAYS']
+        before = get_spend_velocity_by_card(today).get(card.name, 0.0)
+        purchases = [
+            Usage(card_id=card.id, benefit_type='multiplier', benefit_id=0, amount=amount, description='Window test',
+                  date_used=datetime.datetime.combine(today - datetime.timedelta(days=days_ago), datetime.time(12)))
+            for amount, days_ago in ((60.0, window_days - 1), (1000.0, window_days))
+        ]
+        db.session.add_all(purchases)
+        db.session.commit()
+        try:
+            after = get_spend_velocity_by_card(today)[card.name]
+            assert abs(after - before - 60.0 / window_days) < 1e-9
+            print(f"   ✅ Only the purchase inside the {window_days}-day window counted")
+        finally:
+            for purchase in purchases:
+                db.session.delete(purchase)
+            db.session.commit()
+
+if __name__ == "__main__":
+    test_forecast_math()
+    test_forecast_api()
+    test_velocity_window()
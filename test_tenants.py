@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tenant Database Test
+Checks that requests are routed to their household's own database file, that new tenant
+databases are created and seeded on first use, that writes stay inside their tenant, and that
+only TENANT_MAX_OPEN_ENGINES engines are kept open.
+"""
+
+import os
+import shutil
+import tempfile
+from app import create_app, db, list_tenants, tenant_context, Card, Usage
+
+def post_usage(client, tenant, card_id):
+    """Record one purchase for a tenant through the API"""
+    return client.post('/api/usage', headers={'X-Tenant-ID': tenant}, json={
+        'card_id': card_id, 'benefit_type': 'credit', 'benefit_id': 1,
+        'amount': 12.5, 'description': f'Tenant test for {tenant.lower()}'
+    })
+
+def test_tenants():
+    """Test tenant routing against throwaway tenant databases"""
+    print("🧪 Testing tenant databases")
+    tenant_dir = tempfile.mkdtemp()
+    tenant_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tenant_dir, 'main.db'),
+        'TENANT_DATABASE_DIR': os.path.join(tenant_dir, 'tenants'),
+        'TENANT_MAX_OPEN_ENGINES': 2,
+    }, blueprints=['api'])
+    tenant_engines = tenant_app.extensions['tenant_engines']
+
+    try:
+        with tenant_app.test_client() as client:
+            print("\n1️⃣ A new tenant gets its own seeded database...")
+            data = client.get('/api/cards', headers={'X-Tenant-ID': 'alpha'}).get_json()
+            assert data['success'] and data['cards'], data
+            assert list_tenants(tenant_app) == ['alpha']
+            print(f"   ✅ alpha.db created with {len(data['cards'])} cards")
+
+            print("\n2️⃣ Writes stay inside their tenant...")
+            card_id = data['cards'][0]['id']
+            assert post_usage(client, 'alpha', card_id).get_json()['success']
+            assert post_usage(client, 'Beta', card_id).get_json()['success']  # Ids are case-insensitive
+            assert post_usage(client, 'alpha', card_id).get_json()['success']
+            for tenant, expected in (('alpha', 2), ('beta', 1)):
+                with tenant_context(tenant, tenant_app):
+                    assert Usage.query.filter_by(description=f'Tenant test for {tenant}').count() == expected
+                    assert Usage.query.count() == expected
+            with tenant_app.app_context():
+                db.create_all()
+                assert Usage.query.count() == 0 and Card.query.count() == 0
+            print("   ✅ alpha has 2 purchases, beta 1, the main database none")
+
+            print("\n3️⃣ Only the most recently used engines stay open...")
+            assert client.get('/api/cards', headers={'X-Tenant-ID': 'gamma'}).get_json()['success']
+            assert tenant_engines.open_tenants() == ['beta', 'gamma']
+            with tenant_context('alpha', tenant_app):
+                assert Usage.query.count() == 2
+            assert tenant_engines.open_tenants() == ['gamma', 'alpha']
+            print("   ✅ alpha was closed for gamma, and reopened with its data intact")
+
+            print("\n4️⃣ Bad tenant ids are refused...")
+            assert client.get('/api/cards', headers={'X-Tenant-ID': '../main'}).status_code == 400
+            assert list_tenants(tenant_app) == ['alpha', 'beta', 'gamma']
+            print("   ✅ Refused with a 400")
+    finally:
+        tenant_engines.dispose_all()
+        with tenant_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(tenant_dir)
+
+if __name__ == "__main__":
+    test_tenants()
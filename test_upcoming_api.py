@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Upcoming Deadlines API Test
+Checks that /api/upcoming returns one list of resets, deadlines and expiring rewards, soonest first,
+with recurring credits dated by the reset calendar rather than their stored (possibly stale) reset date.
+"""
+
+import datetime
+import os
+import shutil
+import tempfile
+from dateutil.relativedelta import relativedelta
+from app import (create_app, db, initialize_database, reset_expired_credits, CardEnhanced, CreditBenefit2,
+                 DashboardItem)
+
+def test_upcoming_api():
+    """Test the /api/upcoming endpoint against a freshly seeded database"""
+    print("🧪 Testing /api/upcoming")
+    upcoming_dir = tempfile.mkdtemp()
+    upcoming_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(upcoming_dir, 'upcoming.db'),
+    }, blueprints=['api', 'actions'])
+
+    try:
+        with upcoming_app.app_context():
+            initialize_database()
+
+        with upcoming_app.test_client() as client:
+            response = client.get('/api/upcoming?days=366')
+            print(f"   Status Code: {response.status_code}")
+            assert response.status_code == 200
+
+            data = response.get_json()
+            print(f"   ✅ Found {data['count']} upcoming items")
+            dates = [item['date'] for item in data['upcoming']]
+            assert dates == sorted(dates), "Items should be ordered by date"
+            for item in data['upcoming']:
+                assert item['type'] in ('credit_reset', 'signup_deadline', 'reward_expiry')
+                assert 0 <= item['days_left'] <= 366
+
+            # The seeded reset dates are long past, yet monthly credits still reset on the 1st of next month
+            next_month = (datetime.date.today() + relativedelta(months=1)).replace(day=1)
+            doordash = [item for item in data['upcoming']
+                        if item['name'] == 'DoorDash Credit' and item['card_name'] == 'Chase Sapphire Reserve']
+            assert doordash and doordash[0]['type'] == 'credit_reset', data['upcoming'][:5]
+            assert doordash[0]['date'] == next_month.isoformat()
+            first = data['upcoming'][0]
+            print(f"   📅 Next up: {first['name']} on {first['card_name']} ({first['days_left']} days)")
+            print("   ✅ Monthly credits show their next calendar reset")
+
+            # A used credit drops out until it resets
+            assert client.post('/mark-credit-used', json={
+                'type': 'monthly', 'card_name': 'Chase Sapphire Reserve', 'identifier': 'DoorDash Credit'
+            }).get_json()['success']
+            names = {(item['card_name'], item['name']) for item in client.get('/api/upcoming?days=366').get_json()['upcoming']}
+            assert ('Chase Sapphire Reserve', 'DoorDash Credit') not in names
+            assert ('Chase Sapphire Reserve', 'Lyft Credit') in names
+            print("   ✅ Used credits are left out")
+
+            # Reads never rebuild a row whose reset has come: the daily reset job does
+            with upcoming_app.app_context():
+                lyft = CreditBenefit2.query.join(CardEnhanced).filter(
+                    CardEnhanced.name == 'Chase Sapphire Reserve', CreditBenefit2.benefit_name == 'Lyft Credit'
+                ).one()
+                lyft_id = lyft.id
+                yesterday = datetime.date.today() - datetime.timedelta(days=1)
+                DashboardItem.query.filter_by(entity_type='credit', entity_id=lyft_id).update({'valid_until': yesterday})
+                db.session.commit()
+            names = {(item['card_name'], item['name']) for item in client.get('/api/upcoming?days=366').get_json()['upcoming']}
+            assert ('Chase Sapphire Reserve', 'Lyft Credit') not in names
+            with upcoming_app.app_context():
+                assert DashboardItem.query.filter_by(entity_type='credit', entity_id=lyft_id).one().valid_until == yesterday
+                reset_expired_credits()
+            lyft_reset = [item for item in client.get('/api/upcoming?days=366').get_json()['upcoming']
+                          if (item['card_name'], item['name']) == ('Chase Sapphire Reserve', 'Lyft Credit')]
+            assert lyft_reset and lyft_reset[0]['date'] == next_month.isoformat(), lyft_reset
+            print("   ✅ GET leaves stale rows alone and the reset job rebuilds them")
+
+            # Bad input is rejected
+            response = client.get('/api/upcoming?days=0')
+            assert response.status_code == 400
+            print("   ✅ Invalid day counts are rejected")
+    finally:
+        with upcoming_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(upcoming_dir)
+
+if __name__ == "__main__":
+    test_upcoming_api()
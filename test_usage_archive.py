@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Usage Archive Test
+Checks that old usage moves into compressed monthly files, that the rollup keeps its totals,
+that date-range reads stream archived months back transparently, and that each tenant's
+archive is kept apart.
+"""
+
+import datetime
+import os
+import shutil
+import tempfile
+from app import (app, db, DEFAULT_WALLET_ID, create_app, create_tables, initialize_database, tenant_context,
+                 archive_old_usage, compact_database, get_archived_usage_months, read_usage_archive,
+                 rebuild_usage_rollup, Card, Usage, UsageMonthlyRollup)
+
+def test_usage_archive():
+    """Test usage archival, compaction and the archive-aware read path"""
+    print("🧪 Testing usage archive")
+    create_tables()
+
+    archive_dir = tempfile.mkdtemp()
+    original_dir = app.config['USAGE_ARCHIVE_DIR']
+    app.config['USAGE_ARCHIVE_DIR'] = archive_dir
+
+    with app.app_context(), app.test_client() as client:
+        card = Card.query.first()
+        records = [
+            Usage(card_id=card.id, benefit_type='archive-test', benefit_id=1, amount=amount,
+                  description=f'Archive test {index}', date_used=date_used)
+            for index, (date_used, amount) in enumerate((
+                (datetime.datetime(2012, 1, 5), 12.0),
+                (datetime.datetime(2012, 1, 20), 8.0),
+                (datetime.datetime(2012, 2, 3), 30.0),
+            ))
+        ]
+        db.session.add_all(records)
+        db.session.commit()
+        record_ids = [record.id for record in records]
+
+        try:
+            print("\n1️⃣ Old months move into compressed files...")
+            archived = archive_old_usage(datetime.date(2013, 1, 1))
+            assert archived.get('2012-01') == 2 and archived.get('2012-02') == 1, archived
+            assert {'2012-01', '2012-02'} <= set(get_archived_usage_months())
+            assert [row['amount'] for row in read_usage_archive('2012-01')] == [12.0, 8.0]
+            assert Usage.query.filter(Usage.id.in_(record_ids)).count() == 0
+            print(f"   ✅ Archived {sum(archived.values())} records, removed from the database")
+
+            print("\n2️⃣ The rollup keeps archived totals, even after a rebuild...")
+            for attempt in ('incremental', 'rebuilt'):
+                row = db.session.get(UsageMonthlyRollup, (DEFAULT_WALLET_ID, card.id, 'archive-test', '2012-01'))
+                assert row and row.sum_amount == 20.0 and row.count == 2, attempt
+                rebuild_usage_rollup()
+            print("   ✅ January 2012 still totals $20.00 / 2")
+
+            print("\n3️⃣ Date ranges read archived months back...")
+            response = client.get('/api/usage?from=2012-01-01&to=2012-02-01')
+            data = response.get_json()
+            ours = [row for row in data['usage_history'] if row['benefit_type'] == 'archive-test']
+            assert [row['amount'] for row in ours] == [8.0, 12.0]  # newest first
+            assert ours[0]['card_name'] == card.name
+            assert client.get('/api/usage?from=yesterday').status_code == 400
+            print(f"   ✅ Streamed {data['total_usage_records']} records for January 2012")
+
+            print("\n4️⃣ The database is compacted...")
+            if db.engine.dialect.name == 'postgresql':
+                assert compact_database() == 'vacuumed'
+                print("   ✅ VACUUM ANALYZE ran")
+            else:
+                assert compact_database() in ('converted', 'incremental')
+                assert compact_database() == 'incremental'
+                print("   ✅ Incremental vacuum ran")
+        finally:
+            app.config['USAGE_ARCHIVE_DIR'] = original_dir
+            shutil.rmtree(archive_dir)
+            Usage.query.filter(Usage.id.in_(record_ids)).delete(synchronize_session=False)
+            UsageMonthlyRollup.query.filter_by(benefit_type='archive-test').delete()
+            db.session.commit()
+
+def test_tenant_usage_archives():
+    """Test that `usage archive` archives every tenant into its own folder"""
+    print("🧪 Testing tenant usage archives")
+    tenant_dir = tempfile.mkdtemp()
+    archive_dir = os.path.join(tenant_dir, 'archive')
+    tenant_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tenant_dir, 'main.db'),
+        'TENANT_DATABASE_DIR': os.path.join(tenant_dir, 'tenants'),
+        'USAGE_ARCHIVE_DIR': archive_dir,
+    }, blueprints=['api'])
+
+    try:
+        with tenant_app.app_context():
+            initialize_database()
+        # The same month in every database, with the same (fresh) usage ids
+        for tenant, amount in ((None, 1.0), ('alpha', 2.0), ('beta', 3.0)):
+            with tenant_context(tenant, tenant_app):
+                db.session.add(Usage(card_id=Card.query.first().id, benefit_type='archive-test', benefit_id=1,
+                                     amount=amount, description=f'Archived by {tenant or "main"}',
+                                     date_used=datetime.datetime(2012, 3, 9)))
+                db.session.commit()
+
+        print("\n1️⃣ usage archive covers the main database and every tenant...")
+        result = tenant_app.test_cli_runner().invoke(args=['usage', 'archive'])
+        assert result.exit_code == 0, result.output
+        assert 'Tenant alpha: archived 1' in result.output and 'Tenant beta: archived 1' in result.output, result.output
+        for folder in (archive_dir, os.path.join(archive_dir, 'alpha'), os.path.join(archive_dir, 'beta')):
+            assert os.path.exists(os.path.join(folder, 'usage-2012-03.jsonl.gz')), folder
+        print("   ✅ One archive folder per tenant")
+
+        print("\n2️⃣ Each tenant only reads back its own archive...")
+        with tenant_app.test_client() as client:
+            for tenant, amount in ((None, 1.0), ('alpha', 2.0), ('beta', 3.0)):
+                headers = {'X-Tenant-ID': tenant} if tenant else {}
+                data = client.get('/api/usage?from=2012-03-01&to=2012-04-01', headers=headers).get_json()
+                assert [row['amount'] for row in data['usage_history']] == [amount], (tenant, data)
+        print("   ✅ main, alpha and beta each see one archived record: their own")
+    finally:
+        with tenant_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        tenant_app.extensions['tenant_engines'].dispose_all()
+        shutil.rmtree(tenant_dir)
+
+if __name__ == "__main__":
+    test_usage_archive()
+    test_tenant_usage_archives()
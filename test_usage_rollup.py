@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Monthly Usage Rollup Test
+Checks that recording, correcting and deleting usage keeps the monthly rollup in step,
+that a rebuild gives the same totals, and that /api/analytics/usage reads from it.
+"""
+
+import datetime
+from app import app, db, create_tables, rebuild_usage_rollup, Card, Usage, UsageMonthlyRollup
+
+def rollup_totals():
+    """Every rollup row as {(card_id, benefit_type, month): (sum_amount, count)}, skipping empty ones"""
+    return {
+        (row.card_id, row.benefit_type, row.month): (round(row.sum_amount, 2), row.count)
+        for row in UsageMonthlyRollup.query.all() if row.count
+    }
+
+def test_usage_rollup():
+    """Test the monthly usage rollup and /api/analytics/usage"""
+    print("🧪 Testing monthly usage rollup")
+    create_tables()
+
+    with app.app_context(), app.test_client() as client:
+        card = Card.query.first()
+        key = (card.id, 'rollup-test', '2020-03')
+
+        print("\n1️⃣ Recording usage adds to its month...")
+        records = [
+            Usage(card_id=card.id, benefit_type='rollup-test', benefit_id=1, amount=amount,
+                  description='Rollup test', date_used=datetime.datetime(2020, 3, day))
+            for day, amount in ((2, 10.0), (15, 25.5), (31, 4.5))
+        ]
+        db.session.add_all(records)
+        db.session.commit()
+        try:
+            assert rollup_totals()[key] == (40.0, 3)
+            print("   ✅ Three March purchases rolled up to $40.00 / 3")
+
+            print("\n2️⃣ Correcting a purchase moves it to its new month...")
+            records[2].date_used = datetime.datetime(2020, 4, 1)
+            db.session.commit()
+            totals = rollup_totals()
+            assert totals[key] == (35.5, 2)
+            assert totals[(card.id, 'rollup-test', '2020-04')] == (4.5, 1)
+            print("   ✅ March and April both updated")
+
+            print("\n3️⃣ A rebuild matches the incremental totals...")
+            incremental = rollup_totals()
+            rebuild_usage_rollup()
+            assert rollup_totals() == incremental
+            print(f"   ✅ {len(incremental)} rollup rows match")
+
+            print("\n4️⃣ /api/analytics/usage groups the rollup...")
+            data = client.get('/api/analytics/usage?group=card,type,month&from=2020-03&to=2020-04').get_json()
+            assert data['success']
+            ours = [row for row in data['results'] if row['type'] == 'rollup-test']
+            assert [(row['month'], row['sum_amount'], row['count']) for row in ours] == [('2020-03', 35.5, 2), ('2020-04', 4.5, 1)]
+            assert ours[0]['card_name'] == card.name
+            yearly = client.get('/api/analytics/usage?group=type,year&from=2020-01&to=2020-12').get_json()
+            assert {'type': 'rollup-test', 'year': '2020', 'sum_amount': 40.0, 'count': 3} in yearly['results']
+            assert client.get('/api/analytics/usage?group=merchant').status_code == 400
+            assert client.get('/api/analytics/usage?from=March').status_code == 400
+            print("   ✅ Grouped by month and by year, bad parameters rejected")
+        finally:
+            for record in records:
+                db.session.delete(record)
+            db.session.commit()
+
+        print("\n5️⃣ Deleting usage takes it back out...")
+        totals = rollup_totals()
+        assert key not in totals and (card.id, 'rollup-test', '2020-04') not in totals
+        print("   ✅ Test months are empty again")
+
+if __name__ == "__main__":
+    test_usage_rollup()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Group-Commit Usage Writer Test
+Checks that POST /api/usage still acknowledges every row when write-behind mode is on, that one bad
+row in a batch only fails its own request, and that Idempotency-Key retries never record a row twice.
+"""
+
+import json
+import time
+from threading import Thread
+from app import app, db, create_tables, Card, Usage, UsageWriteQueue
+
+def test_usage_write_queue():
+    """Record usage concurrently through the write-behind queue"""
+    print("🧪 Testing group-commit usage writer")
+    create_tables()
+
+    with app.app_context():
+        card = Card.query.first()
+        assert card, "Sample data is missing - run app.py once first"
+        card_id = card.id
+
+    marker = '[write-queue test]'
+    responses = []
+
+    def post_usage(n):
+        with app.test_client() as client:
+            response = client.post('/api/usage',
+                                   data=json.dumps({
+                                       'card_id': card_id,
+                                       'benefit_type': 'credit',
+                                       'benefit_id': 1,
+                                       'amount': 5.0,
+                                       'description': f'{marker} {n}'
+                                   }),
+                                   content_type='application/json')
+            responses.append((response.status_code, response.get_json()))
+
+    app.config['USAGE_WRITE_BEHIND'] = True
+    try:
+        threads = [Thread(target=post_usage, args=(n,)) for n in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        app.config['USAGE_WRITE_BEHIND'] = False
+
+    try:
+        assert all(status == 201 for status, _ in responses), responses
+        usage_ids = {data['usage_id'] for _, data in responses}
+        print(f"   ✅ {len(usage_ids)} usage rows acknowledged")
+        assert len(usage_ids) == 20
+
+        # Every acknowledged row must already be committed
+        with app.app_context():
+            saved = Usage.query.filter(Usage.id.in_(usage_ids)).count()
+            assert saved == 20
+            print("   ✅ All acknowledged rows are in the database")
+    finally:
+        with app.app_context():
+            Usage.query.filter(Usage.description.startswith(marker)).delete(synchronize_session=False)
+            db.session.commit()
+
+def test_bad_row_in_batch():
+    """A row that can't be inserted fails alone; the rest of its batch is still saved"""
+    print("🧪 Testing a bad row inside a batch")
+    marker = '[bad-row test]'
+    writer = UsageWriteQueue(app, max_rows=10, max_ms=200, max_queue_size=100)
+
+    with app.app_context():
+        card_id = Card.query.first().id
+        row = {'card_id': card_id, 'benefit_type': 'credit', 'benefit_id': 1}
+        futures = [writer.submit(dict(row, amount=5.0, description=f'{marker} {n}')) for n in range(3)]
+        bad = writer.submit(dict(row, amount=None, description=f'{marker} bad'))  # amount can't be NULL
+        futures.append(writer.submit(dict(row, amount=5.0, description=f'{marker} 3')))
+
+    try:
+        usage_ids = [future.result(timeout=10) for future in futures]
+        assert bad.exception(timeout=10) is not None
+        with app.app_context():
+            assert Usage.query.filter(Usage.id.in_(usage_ids)).count() == 4
+        print("   ✅ 4 good rows saved, only the bad one failed")
+    finally:
+        writer.stop()
+        with app.app_context():
+            Usage.query.filter(Usage.description.startswith(marker)).delete(synchronize_session=False)
+            db.session.commit()
+
+def test_idempotent_retries():
+    """Posting with the same Idempotency-Key twice saves one row, including after a 202"""
+    print("🧪 Testing Idempotency-Key retries")
+    marker = '[idempotency test]'
+    with app.app_context():
+        card_id = Card.query.first().id
+    body = json.dumps({'card_id': card_id, 'benefit_type': 'credit', 'benefit_id': 1,
+                       'amount': 5.0, 'description': marker})
+
+    try:
+        with app.test_client() as client:
+            headers = {'Idempotency-Key': 'retry-test-1'}
+            first = client.post('/api/usage', data=body, content_type='application/json', headers=headers)
+            again = client.post('/api/usage', data=body, content_type='application/json', headers=headers)
+            assert first.status_code == 201 and again.status_code == 200
+            assert first.get_json()['usage_id'] == again.get_json()['usage_id']
+            print("   ✅ A retry returns the saved record")
+
+            app.config['USAGE_WRITE_BEHIND'] = True
+            ack_timeout = app.config['USAGE_ACK_TIMEOUT']
+            app.config['USAGE_ACK_TIMEOUT'] = 0  # Never wait, so the request gets its 202
+            try:
+                headers = {'Idempotency-Key': 'retry-test-2'}
+                accepted = client.post('/api/usage', data=body, content_type='application/json', headers=headers)
+                assert accepted.status_code == 202, accepted.get_json()
+                assert accepted.get_json()['idempotency_key'] == 'retry-test-2'
+
+                deadline = time.monotonic() + 10
+                while True:
+                    retry = client.post('/api/usage', data=body, content_type='application/json', headers=headers)
+                    if retry.status_code == 200:
+                        break
+                    assert retry.status_code == 202 and time.monotonic() < deadline
+                    time.sleep(0.05)
+            finally:
+                app.config['USAGE_WRITE_BEHIND'] = False
+                app.config['USAGE_ACK_TIMEOUT'] = ack_timeout
+
+        with app.app_context():
+            assert Usage.query.filter_by(request_key='retry-test-2').count() == 1
+        print("   ✅ A 202 retried with its key is saved exactly once")
+    finally:
+        with app.app_context():
+            Usage.query.filter(Usage.description == marker).delete(synchronize_session=False)
+            db.session.commit()
+
+if __name__ == "__main__":
+    test_usage_write_queue()
+    test_bad_row_in_batch()
+    test_idempotent_retries()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Portfolio Valuation Test
+Checks the per-card annual value math and that /api/valuation is cached
+until the wallet version changes.
+"""
+
+from app import app, db, create_tables, get_wallet_version, CardEnhanced, CreditBenefit2
+
+ANNUAL_FACTORS = {'monthly': 12, 'quarterly': 4, 'semi-annual': 2, 'annual': 1}
+
+def test_valuation():
+    """Test /api/valuation"""
+    print("🧪 Testing portfolio valuation")
+    create_tables()
+
+    with app.app_context(), app.test_client() as client:
+        print("\n1️⃣ Credits are annualized by frequency and the fee is subtracted...")
+        data = client.get('/api/valuation').get_json()
+        assert data['success']
+        card_values = {card['card_id']: card for card in data['cards']}
+
+        for card in CardEnhanced.query.all():
+            expected_credits = sum(
+                credit.credit_amount * ANNUAL_FACTORS.get(credit.frequency, 0)
+                + (credit.credit_amount / app.config['ONETIME_CREDIT_YEARS'] if credit.frequency == 'onetime' else 0)
+                for credit in card.credit_benefits if not credit.from_spending_bonus
+            )
+            value = card_values[card.id]
+            assert abs(value['credit_value'] - expected_credits) < 0.01, card.name
+            assert abs(value['net_value'] - (value['gross_value'] - card.annual_fee)) < 0.01, card.name
+        print(f"   ✅ {len(card_values)} cards valued, wallet net value ${data['wallet']['net_value']:,.2f}")
+
+        print("\n2️⃣ Repeat requests are served from the cache...")
+        again = client.get('/api/valuation').get_json()
+        assert again['cached'] and again['wallet_version'] == data['wallet_version']
+        print("   ✅ Cached while the wallet version is unchanged")
+
+        print("\n3️⃣ Changing a credit bumps the version and the value...")
+        card = CardEnhanced.query.first()
+        credit = CreditBenefit2(card_id=card.id, benefit_name='Valuation Test Credit', credit_amount=10.0,
+                                description='Valuation test', frequency='monthly')
+        db.session.add(credit)
+        db.session.commit()
+        try:
+            assert get_wallet_version() > data['wallet_version']
+            updated = client.get('/api/valuation').get_json()
+            assert not updated['cached']
+            before = card_values[card.id]['credit_value']
+            after = next(c for c in updated['cards'] if c['card_id'] == card.id)['credit_value']
+            assert abs(after - before - 120.0) < 0.01
+            print(f"   ✅ $10 monthly credit added ${after - before:.0f} a year to {card.name}")
+        finally:
+            db.session.delete(credit)
+            db.session.commit()
+
+if __name__ == "__main__":
+    test_valuation()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Wallet Event Log Test
+Checks that mutation routes append events, that /api/audit shows them, that undo reverses the
+last change to a credit or bonus, that undoing one nightly reset leaves the others alone, and that
+undo refuses to overwrite a row that has changed again since.
+"""
+
+import datetime
+import os
+import shutil
+import tempfile
+from app import (app, create_app, db, create_tables, initialize_database, reset_expired_credits, wallet_context,
+                 get_real_signup_bonuses, get_real_credits_by_frequency, ALL_WALLETS,
+                 CardEnhanced, CreditBenefit2, CreditStatus, OtherBonus, SignupBonus, WalletEvent, DashboardItem)
+
+def test_wallet_events():
+    """Test event logging, /api/audit, /api/undo and /undo-bonus-completion"""
+    print("🧪 Testing wallet event log")
+    create_tables()
+
+    with app.app_context(), app.test_client() as client:
+        print("\n1️⃣ Completing a signup bonus is logged and can be undone...")
+        bonus = get_real_signup_bonuses()[0]
+        card = CardEnhanced.query.filter_by(name=bonus['card_name']).first()
+        signup_bonus = SignupBonus.query.filter_by(card_id=card.id, description=bonus['description']).first()
+        status_before = signup_bonus.status
+
+        response = client.post('/mark-signup-bonus-complete', json={
+            'card_name': bonus['card_name'], 'description': bonus['description']
+        })
+        assert response.status_code == 200
+
+        audit = client.get(f'/api/audit?entity_type=signup_bonus&entity_id={signup_bonus.id}').get_json()
+        latest = audit['events'][0]
+        assert latest['event_type'] == 'signup_bonus_completed'
+        assert latest['before']['status'] == status_before and latest['after']['status'] == 'completed'
+        print("   ✅ Event recorded with before/after values")
+
+        response = client.post('/api/undo', json={'entity_type': 'signup_bonus', 'entity_id': signup_bonus.id})
+        assert response.status_code == 200
+        db.session.expire_all()
+        assert db.session.get(SignupBonus, signup_bonus.id).status == status_before
+        assert client.post('/api/undo', json={'entity_type': 'signup_bonus', 'entity_id': signup_bonus.id}).status_code == 404
+        print("   ✅ Undo restored the status (and can't be applied twice)")
+
+        print("\n2️⃣ Marking a credit used can be undone...")
+        credit = get_real_credits_by_frequency('monthly')[0]
+        client.post('/mark-credit-used', json={
+            'type': 'monthly', 'card_name': credit['card_name'], 'identifier': credit['benefit_name']
+        })
+        credit_event = WalletEvent.query.filter_by(event_type='credit_used').order_by(WalletEvent.id.desc()).first()
+        response = client.post('/api/undo', json={'entity_type': 'credit_status', 'entity_id': credit_event.entity_id})
+        assert response.status_code == 200
+        statuses = {c['benefit_name']: c['status'] for c in get_real_credits_by_frequency('monthly')
+                    if c['card_name'] == credit['card_name']}
+        assert statuses[credit['benefit_name']] == 'available'
+        print(f"   ✅ {credit['benefit_name']} is available again")
+
+        print("\n3️⃣ Undoing a threshold bonus completion removes the reward credit...")
+        card = CardEnhanced.query.first()
+        threshold = OtherBonus(card_id=card.id, bonus_type='threshold', bonus_amount='1 night',
+                               description='Event log test bonus', required_spend=1000.0, frequency='annual')
+        db.session.add(threshold)
+        db.session.commit()
+        try:
+            response = client.post('/mark-spending-bonus-complete', json={
+                'card_name': card.name, 'category': threshold.description, 'multiplier': '1 night'
+            })
+            assert response.status_code == 200
+            reward = CreditBenefit2.query.filter_by(spending_bonus_id=threshold.id).first()
+            assert reward is not None
+
+            response = client.post('/undo-bonus-completion', json={
+                'card_name': card.name, 'benefit_name': reward.benefit_name, 'spending_bonus_id': threshold.id
+            })
+            assert response.status_code == 200
+            db.session.expire_all()
+            assert CreditBenefit2.query.filter_by(spending_bonus_id=threshold.id).first() is None
+            assert db.session.get(OtherBonus, threshold.id).status == 'pending'
+            assert not DashboardItem.query.filter_by(entity_type='credit', entity_id=reward.id).first()
+            undo_events = WalletEvent.query.filter_by(event_type='undo').filter(
+                WalletEvent.entity_type.in_(['credit', 'other_bonus'])
+            ).order_by(WalletEvent.id.desc()).limit(2).all()
+            assert {event.entity_type for event in undo_events} == {'credit', 'other_bonus'}
+            print("   ✅ Reward credit removed and bonus back to pending")
+        finally:
+            for leftover in CreditBenefit2.query.filter_by(spending_bonus_id=threshold.id).all():
+                db.session.delete(leftover)
+            db.session.delete(db.session.get(OtherBonus, threshold.id))
+            DashboardItem.query.filter_by(entity_type='other_bonus', entity_id=threshold.id).delete()
+            db.session.commit()
+
+def test_undo_scope():
+    """Test that undo only reverses one credit's reset and never overwrites a newer change"""
+    print("🧪 Testing undo scope and stale undo")
+    undo_dir = tempfile.mkdtemp()
+    undo_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(undo_dir, 'undo.db'),
+    }, blueprints=['api', 'actions'])
+
+    try:
+        with undo_app.app_context():
+            initialize_database()
+            for name in ('DoorDash Credit', 'Lyft Credit'):
+                db.session.add(CreditStatus(card_name='Chase Sapphire Reserve', credit_type='monthly',
+                                            credit_identifier=name, status='used',
+                                            last_updated=datetime.datetime(2025, 1, 15)))
+            db.session.commit()
+            with wallet_context(ALL_WALLETS):
+                reset_expired_credits()
+            resets = WalletEvent.query.filter_by(event_type='credit_reset').all()
+            assert len(resets) == 2 and resets[0].change_id != resets[1].change_id
+            doordash_status_id = CreditStatus.query.filter_by(credit_identifier='DoorDash Credit').one().id
+
+        with undo_app.test_client() as client:
+            print("\n1️⃣ Undoing one credit's nightly reset leaves the others alone...")
+            response = client.post('/api/undo', json={'entity_type': 'credit_status', 'entity_id': doordash_status_id})
+            assert response.status_code == 200, response.get_json()
+            undone = response.get_json()['undone']
+            with undo_app.app_context():
+                doordash_credit_ids = {credit.id for credit in CreditBenefit2.query.filter_by(benefit_name='DoorDash Credit')}
+                assert {(event['entity_type'], event['entity_id']) for event in undone} <= (
+                    {('credit_status', doordash_status_id)} | {('credit', credit_id) for credit_id in doordash_credit_ids}
+                )
+                reset_dates = {credit.benefit_name: credit.reset_date for credit in CreditBenefit2.query.filter(
+                    CreditBenefit2.benefit_name.in_(['DoorDash Credit', 'Lyft Credit'])
+                )}
+                assert reset_dates['DoorDash Credit'] == datetime.date(2025, 2, 1)  # Put back
+                assert reset_dates['Lyft Credit'] > datetime.date.today()  # Still advanced
+            print("   ✅ Only the DoorDash credit's reset was reversed")
+
+            print("\n2️⃣ A change edited since can't be undone...")
+            assert client.post('/mark-credit-used', json={
+                'type': 'monthly', 'card_name': 'Chase Sapphire Reserve', 'identifier': 'Lyft Credit'
+            }).get_json()['success']
+            with undo_app.app_context():
+                lyft_status = CreditStatus.query.filter_by(credit_identifier='Lyft Credit').one()
+                lyft_status.last_updated = datetime.datetime.utcnow()  # A change the event log doesn't know about
+                db.session.commit()
+                lyft_status_id = lyft_status.id
+            response = client.post('/api/undo', json={'entity_type': 'credit_status', 'entity_id': lyft_status_id})
+            assert response.status_code == 409, response.get_json()
+            with undo_app.app_context():
+                assert db.session.get(CreditStatus, lyft_status_id).status == 'used'
+            print("   ✅ Refused with 409, the newer row was left alone")
+    finally:
+        with undo_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(undo_dir)
+
+if __name__ == "__main__":
+    test_wallet_events()
+    test_undo_scope()
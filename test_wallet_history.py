@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Point-in-Time Wallet Test
+Checks that credit status changes are kept as intervals and that
+/api/wallet?as_of= shows the wallet as it stood on an earlier date.
+"""
+
+import datetime
+from app import app, db, create_tables, get_real_credits_by_frequency, CreditStatus, CreditStatusInterval
+
+def _section_names(sections, section):
+    return {(credit['card_name'], credit.get('benefit_name')) for credit in sections.get(section, [])}
+
+def test_wallet_history():
+    """Test status intervals and /api/wallet"""
+    print("🧪 Testing point-in-time wallet queries")
+    create_tables()
+
+    with app.app_context(), app.test_client() as client:
+        credit = get_real_credits_by_frequency('annual')[0]
+        key = (credit['card_name'], credit['benefit_name'])
+
+        # Remember the history as it is now so the test can put it back afterwards
+        last_interval_id = db.session.query(db.func.max(CreditStatusInterval.id)).scalar() or 0
+        open_before = CreditStatusInterval.query.filter_by(
+            card_name=credit['card_name'], credit_type='annual',
+            credit_identifier=credit['benefit_name'], valid_to=None
+        ).first()
+        open_before_id = open_before.id if open_before else None
+
+        print("\n1️⃣ Marking a credit used opens a new status interval...")
+        client.post('/mark-credit-used', json={
+            'type': 'annual', 'card_name': credit['card_name'], 'identifier': credit['benefit_name']
+        })
+        try:
+            open_interval = CreditStatusInterval.query.filter_by(
+                card_name=credit['card_name'], credit_type='annual',
+                credit_identifier=credit['benefit_name'], valid_to=None
+            ).one()
+            assert open_interval.status == 'used'
+            print("   ✅ Open 'used' interval recorded")
+
+            print("\n2️⃣ Today's wallet shows it as used...")
+            today = client.get('/api/wallet').get_json()
+            assert key in _section_names(today['sections'], 'used-annual')
+            assert key not in _section_names(today['sections'], 'annual')
+            print("   ✅ Listed under used-annual")
+
+            print("\n3️⃣ Before it was used, it was available...")
+            # Move the interval back in time so a past date can fall before it
+            open_interval.valid_from -= datetime.timedelta(days=3)
+            db.session.commit()
+            as_of = (datetime.date.today() - datetime.timedelta(days=5)).isoformat()
+            past = client.get(f'/api/wallet?as_of={as_of}').get_json()
+            assert past['as_of'] == as_of
+            assert key in _section_names(past['sections'], 'annual')
+            assert key not in _section_names(past['sections'], 'used-annual')
+            print(f"   ✅ Available on {as_of}")
+        finally:
+            client.post('/mark-credit-available', json={
+                'card_name': credit['card_name'], 'identifier': credit['benefit_name']
+            })
+
+        closed = CreditStatusInterval.query.filter_by(
+            card_name=credit['card_name'], credit_type='annual', credit_identifier=credit['benefit_name']
+        ).order_by(CreditStatusInterval.id.desc()).limit(2).all()
+        assert closed[0].status == 'available' and closed[0].valid_to is None
+        assert closed[1].status == 'used' and closed[1].valid_to is not None
+        print("   ✅ Marking it available closed the 'used' interval")
+
+        CreditStatusInterval.query.filter(CreditStatusInterval.id > last_interval_id).delete()
+        if open_before_id:
+            db.session.get(CreditStatusInterval, open_before_id).valid_to = None
+        db.session.commit()
+
+        print("\n4️⃣ Bad dates are rejected...")
+        assert client.get('/api/wallet?as_of=not-a-date').status_code == 400
+        future = (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+        assert client.get(f'/api/wallet?as_of={future}').status_code == 400
+        print("   ✅ 400 for invalid and future dates")
+
+if __name__ == "__main__":
+    test_wallet_history()
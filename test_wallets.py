@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Wallet Test
+Checks that one database holds several wallets, that the X-Wallet-ID header (with the wallet's key) or a
+browser session opened at /wallet/open picks which one a request sees, that writes stay inside their
+wallet, and that scheduled jobs cover every wallet in one run.
+"""
+
+import os
+import shutil
+import tempfile
+from app import (create_app, db, initialize_database, create_wallet, issue_wallet_key, wallet_context,
+                 reset_expired_credits, ALL_WALLETS, CardEnhanced, CreditStatus, Usage, WalletEvent)
+
+wallet_keys = {}
+
+def wallet_headers(wallet_id):
+    return {'X-Wallet-ID': str(wallet_id), 'X-Wallet-Key': wallet_keys[wallet_id]}
+
+def test_wallets():
+    """Test wallet scoping against a throwaway database"""
+    print("🧪 Testing wallets")
+    wallet_dir = tempfile.mkdtemp()
+    wallet_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(wallet_dir, 'wallets.db'),
+    }, blueprints=['api', 'actions', 'dashboard'])
+
+    try:
+        with wallet_app.app_context():
+            initialize_database()
+            second_wallet = create_wallet('Second wallet')
+            wallet_keys[second_wallet] = issue_wallet_key(second_wallet)
+            card_names = sorted(card.name for card in CardEnhanced.query.all())
+
+        with wallet_app.test_client() as client:
+            print("\n1️⃣ A new wallet gets its own copy of the catalog...")
+            first = client.get('/api/changes').get_json()
+            second = client.get('/api/changes', headers=wallet_headers(second_wallet)).get_json()
+            assert first['success'] and second['success'], (first, second)
+            assert sorted(card['name'] for card in second['changes']['cards']) == card_names
+            first_ids = {card['id'] for card in first['changes']['cards']}
+            assert first_ids.isdisjoint(card['id'] for card in second['changes']['cards'])
+            print(f"   ✅ Wallet {second_wallet} has its own {len(card_names)} cards")
+
+            print("\n2️⃣ Writes stay inside their wallet...")
+            credit = second['changes']['credits'][0]
+            card_name = next(card['name'] for card in second['changes']['cards'] if card['id'] == credit['card_id'])
+            response = client.post('/mark-credit-used', headers=wallet_headers(second_wallet), json={
+                'type': credit['frequency'], 'card_name': card_name, 'identifier': credit['benefit_name']
+            })
+            assert response.get_json()['success'], response.get_json()
+            assert client.post('/api/usage', headers=wallet_headers(second_wallet), json={
+                'card_id': 1, 'benefit_type': 'credit', 'benefit_id': 1, 'amount': 9.5, 'description': 'Wallet test'
+            }).get_json()['success']
+
+            second_after = client.get('/api/changes', headers=wallet_headers(second_wallet)).get_json()
+            assert second_after['version'] > second['version']
+            assert [status['status'] for status in second_after['changes']['credit_statuses']] == ['used']
+            first_after = client.get('/api/changes').get_json()
+            assert first_after['version'] == first['version']
+            assert first_after['changes']['credit_statuses'] == first['changes']['credit_statuses']
+            with wallet_app.app_context():
+                assert Usage.query.filter_by(description='Wallet test').count() == 0
+                with wallet_context(second_wallet):
+                    assert Usage.query.filter_by(description='Wallet test').count() == 1
+                    assert WalletEvent.query.filter_by(event_type='credit_used').count() == 1
+                with wallet_context(ALL_WALLETS):
+                    assert {status.wallet_id for status in CreditStatus.query.all()} == {second_wallet}
+            print("   ✅ The credit and purchase only show up in the second wallet")
+
+            print("\n3️⃣ Bad wallet ids are rejected...")
+            assert client.get('/api/changes', headers={'X-Wallet-ID': 'abc'}).status_code == 400
+            assert client.get('/api/changes', headers={'X-Wallet-ID': '999'}).status_code == 404
+            print("   ✅ 400 for a non-number, 404 for a wallet that doesn't exist")
+
+            print("\n4️⃣ A wallet can only be used with its key...")
+            assert client.get('/api/changes', headers={'X-Wallet-ID': str(second_wallet)}).status_code == 403
+            assert client.get('/api/changes', headers={
+                'X-Wallet-ID': str(second_wallet), 'X-Wallet-Key': 'not-the-key'
+            }).status_code == 403
+            print("   ✅ 403 without the key or with a wrong one")
+
+        with wallet_app.test_client() as browser:
+            print("\n5️⃣ A browser opens a wallet once, then every request uses it...")
+            assert browser.get(f'/wallet/open?wallet={second_wallet}&key=wrong').status_code == 403
+            response = browser.get(f'/wallet/open?wallet={second_wallet}&key={wallet_keys[second_wallet]}')
+            assert response.status_code == 302
+            opened = browser.get('/api/changes').get_json()
+            assert opened['version'] == second_after['version'], "No header needed after opening the wallet"
+            assert browser.get('/').status_code == 200
+            print("   ✅ Pages and API calls without a header see the opened wallet")
+
+            with wallet_app.app_context():
+                wallet_keys[second_wallet] = issue_wallet_key(second_wallet)
+            assert browser.get('/api/changes').get_json()['version'] == first_after['version']
+            print("   ✅ Replacing the key signs the browser out (back to wallet 1)")
+
+            assert browser.post('/wallet/open', json={'wallet': second_wallet, 'key': wallet_keys[second_wallet]}).get_json()['success']
+            assert browser.post('/wallet/close').get_json()['wallet_id'] == 1
+            assert browser.get('/api/changes').get_json()['version'] == first_after['version']
+            print("   ✅ Closing the wallet goes back to wallet 1")
+
+        print("\n6️⃣ Scheduled jobs sweep every wallet at once...")
+        with wallet_app.app_context(), wallet_context(ALL_WALLETS):
+            reset_expired_credits()
+            assert CardEnhanced.query.count() == 2 * len(card_names)
+        print("   ✅ One run covered both wallets")
+    finally:
+        with wallet_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(wallet_dir)
+
+if __name__ == "__main__":
+    test_wallets()
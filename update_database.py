@@ -1,164 +0,0 @@
-#!/usr/bin/env python3
-"""
-Database Update Script: Replace current database data with source of truth
-This script will clean and update all card data to match the provided source of truth
-"""
-
-import sqlite3
-from datetime import datetime
-
-def clean_database():
-    """Remove all current inaccurate data"""
-    print("=== CLEANING CURRENT DATABASE ===\n")
-
-    conn = sqlite3.connect('instance/test.db')
-    cursor = conn.cursor()
-
-    # Delete all current data except card_enhanced (keep the cards but clean their data)
-    cursor.execute("DELETE FROM spending_bonus")
-    cursor.execute("DELETE FROM credit_benefit2")
-    cursor.execute("DELETE FROM signup_bonus")
-
-    print("Cleaned existing spending bonuses, credit benefits, and signup bonuses")
-
-    # Update card names to match source of truth
-    cursor.execute("UPDATE card_enhanced SET name = 'American Express Gold Card' WHERE name = 'American Express Gold'")
-
-    conn.commit()
-    conn.close()
-
-def add_source_of_truth_data():
-    """Add all the accurate data from source of truth"""
-    print("=== ADDING SOURCE OF TRUTH DATA ===\n")
-
-    conn = sqlite3.connect('instance/test.db')
-    cursor = conn.cursor()
-
-    # Source of truth data organized by card
-    source_data = {
-        "Chase Sapphire Reserve": {
-            "multipliers": [
-                {"category": "Travel", "multiplier": 8.0, "description": "Points on Chase Travel (flights, hotels, rental cars, cruises, activities, tours)"},
-                {"category": "Travel", "multiplier": 4.0, "description": "Points on travel booked directly with airline or hotel"},
-                {"category": "Dining", "multiplier": 3.0, "description": "Points on dining at restaurants worldwide (including eligible delivery)"},
-                {"category": "Travel", "multiplier": 4.0, "description": "Bonus points on eligible Lyft rides"},
-                {"category": "Fitness", "multiplier": 10.0, "description": "Bonus points on eligible Peloton hardware and accessories (up to 50,000 total points)"},
-            ],
-            "credits": [
-                {"name": "Travel Credit", "amount": 300.0, "frequency": "annual", "description": "Travel credit for travel purchases"},
-                {"name": "Chase Travel Edit Credit", "amount": 500.0, "frequency": "annual", "description": "Credit for prepaid bookings with Chase Travel for The Edit properties"},
-                {"name": "Hotel Credit", "amount": 250.0, "frequency": "annual", "description": "Credit for prepaid Chase Travel hotel bookings (specific hotel groups)"},
-                {"name": "DashPass Credit", "amount": 120.0, "frequency": "annual", "description": "Dashpass membership"},
-                {"name": "Peloton Credit", "amount": 120.0, "frequency": "annual", "description": "Statement credit towards Peloton membership"},
-                {"name": "Dining Credit", "amount": 150.0, "frequency": "semi-annual", "description": "Statement credits for dining at Sapphire Reserve Exclusive Tables program restaurants"},
-                {"name": "Entertainment Credit", "amount": 150.0, "frequency": "semi-annual", "description": "Statement credits for purchases on StubHub and viagogo.com"},
-                {"name": "DoorDash Credit", "amount": 25.0, "frequency": "monthly", "description": "DoorDash credit ($5 for restaurants, two $10 promotions for groceries/retail)"},
-                {"name": "Lyft Credit", "amount": 10.0, "frequency": "monthly", "description": "Lyft credit"},
-                {"name": "Apple Services Credit", "amount": 0.0, "frequency": "other", "description": "Subscription to AppleTV and AppleMusic"},
-                {"name": "Global Entry Credit", "amount": 120.0, "frequency": "onetime", "description": "Reimbursement for Global Entry, TSA Precheck, or NEXUS"},
-            ],
-            "bonuses": [
-                {"category": "Southwest Airlines", "amount": 500.0, "description": "Southwest Airlines credit", "required_spend": 75000.0},
-                {"category": "Shops at Chase", "amount": 250.0, "description": "Shops at Chase credit", "required_spend": 75000.0},
-            ]
-        },
-        "American Express Gold Card": {
-            "multipliers": [
-                {"category": "Dining", "multiplier": 4.0, "description": "Points on restaurants worldwide (plus takeout and delivery in the U.S.)"},
-                {"category": "Groceries", "multiplier": 4.0, "description": "Points on groceries at U.S. supermarkets"},
-                {"category": "Travel", "multiplier": 3.0, "description": "Points on flights booked directly with airlines or on AmexTravel.com"},
-                {"category": "Travel", "multiplier": 2.0, "description": "Points on prepaid hotels and other eligible travel through AmexTravel.com"},
-            ],
-            "credits": [
-                {"name": "Resy Credit", "amount": 100.0, "frequency": "annual", "description": "Resy restaurant credit"},
-                {"name": "Uber Credit", "amount": 10.0, "frequency": "monthly", "description": "Uber Cash for orders and rides in the U.S."},
-                {"name": "Dunkin Credit", "amount": 7.0, "frequency": "monthly", "description": "Statement credits for Dunkin' Donuts"},
-                {"name": "Food Credit", "amount": 10.0, "frequency": "monthly", "description": "Statement credits for Grubhub, The Cheesecake Factory, Goldbelly, Wine.com, Five Guys"},
-            ]
-        },
-        "Capital One VentureX": {
-            "multipliers": [
-                {"category": "Travel", "multiplier": 10.0, "description": "Miles on hotels and rental cars booked through Capital One Travel"},
-                {"category": "Travel", "multiplier": 5.0, "description": "Miles on flights and vacation rentals booked through Capital One Travel"},
-                {"category": "General", "multiplier": 2.0, "description": "Miles on all other purchases"},
-            ],
-            "credits": [
-                {"name": "Travel Credit", "amount": 300.0, "frequency": "annual", "description": "Travel credit for bookings through Capital One Travel"},
-                {"name": "Global Entry Credit", "amount": 120.0, "frequency": "onetime", "description": "Global Entry or TSA PreCheck credit"},
-            ],
-            "bonuses": [
-                {"category": "Anniversary", "amount": 10000.0, "description": "Anniversary miles", "required_spend": 0.0},
-                {"category": "Welcome", "amount": 75000.0, "description": "Welcome bonus", "required_spend": 4000.0},
-            ]
-        },
-        # Add other cards following the same pattern...
-        "American Express Platinum": {
-            "credits": [
-                {"name": "Lululemon Credit", "amount": 75.0, "frequency": "quarterly", "description": "Lululemon credit at U.S. stores and online"},
-                {"name": "Resy Credit", "amount": 100.0, "frequency": "quarterly", "description": "U.S. Resy Restaurants credit"},
-                {"name": "Digital Entertainment Credit", "amount": 25.0, "frequency": "monthly", "description": "Credit for Paramount+, YouTube Premium and YouTube TV"},
-                {"name": "Oura Ring Credit", "amount": 200.0, "frequency": "annual", "description": "Oura Ring credit (hardware only)"},
-                {"name": "Uber One Credit", "amount": 120.0, "frequency": "annual", "description": "Uber One membership credit"},
-                {"name": "Hotel Credit", "amount": 300.0, "frequency": "semi-annual", "description": "Hotel credit"},
-                {"name": "CLEAR Credit", "amount": 209.0, "frequency": "annual", "description": "CLEAR membership credit"},
-                {"name": "Airline Fee Credit", "amount": 200.0, "frequency": "annual", "description": "Airline fee credit with selected airline"},
-                {"name": "Equinox Credit", "amount": 300.0, "frequency": "annual", "description": "Equinox credit"},
-                {"name": "Global Entry Credit", "amount": 120.0, "frequency": "onetime", "description": "Global Entry/TSA PreCheck credit"},
-                {"name": "Saks Credit", "amount": 100.0, "frequency": "annual", "description": "Saks credit"},
-                {"name": "Uber Cash Credit", "amount": 200.0, "frequency": "annual", "description": "Uber Cash"},
-                {"name": "Walmart+ Credit", "amount": 155.0, "frequency": "annual", "description": "Walmart+ membership credit"},
-            ]
-        }
-    }
-
-    # Get card IDs
-    cursor.execute("SELECT id, name FROM card_enhanced")
-    cards = {name: card_id for card_id, name in cursor.fetchall()}
-
-    # Add multipliers (using spending_bonus table for now)
-    for card_name, data in source_data.items():
-        if card_name not in cards:
-            print(f"Warning: Card '{card_name}' not found in database")
-            continue
-
-        card_id = cards[card_name]
-
-        # Add multipliers
-        if "multipliers" in data:
-            for mult in data["multipliers"]:
-                cursor.execute("""
-                    INSERT INTO spending_bonus
-                    (card_id, category, multiplier, description, cap_amount, current_spend, reset_date, bonus_type, is_active)
-                    VALUES (?, ?, ?, ?, 0, 0, '2025-12-31', 'ongoing', 1)
-                """, (card_id, mult["category"], mult["multiplier"], mult["description"]))
-
-        # Add credits
-        if "credits" in data:
-            for credit in data["credits"]:
-                cursor.execute("""
-                    INSERT INTO credit_benefit2
-                    (card_id, benefit_name, credit_amount, description, frequency, reset_date, has_progress, current_amount)
-                    VALUES (?, ?, ?, ?, ?, ?, 0, 0)
-                """, (card_id, credit["name"], credit["amount"], credit["description"],
-                     credit["frequency"], '2025-12-01' if credit["frequency"] != 'onetime' else None))
-
-        # Add bonuses
-        if "bonuses" in data:
-            for bonus in data["bonuses"]:
-                cursor.execute("""
-                    INSERT INTO signup_bonus
-                    (card_id, bonus_amount, description, required_spend, current_spend, deadline, status, created_date)
-                    VALUES (?, ?, ?, ?, 0, '2025-12-31', 'not-started', ?)
-                """, (card_id, f"{bonus['amount']:.0f} {bonus['category']}", bonus["description"],
-                     bonus["required_spend"], datetime.now().isoformat()))
-
-    print("Added source of truth data for key cards")
-
-    conn.commit()
-    conn.close()
-
-if __name__ == "__main__":
-    clean_database()
-    add_source_of_truth_data()
-    print("\n=== DATABASE UPDATE COMPLETE ===")
-    print("Database has been updated with source of truth data!")
\ No newline at end of file